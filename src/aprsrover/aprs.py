@@ -59,14 +59,69 @@ This module is designed to be imported and used from other Python scripts.
 """
 
 from typing import AsyncGenerator, Optional, Callable, Awaitable, Protocol, Any
-from ax253 import Frame
+from ax253 import Address, Frame
+import functools
 import logging
 import asyncio
-import re
 
 __all__ = ["Aprs", "AprsError", "KISSInterface"]
 
 
+@functools.lru_cache(maxsize=256)
+def _address(spec: str, last: bool = False) -> Address:
+    """
+    Parse a TNC2 address (e.g. "WIDE1-1"), caching the result.
+
+    Addresses are immutable, so the same few callsigns and path entries used on every
+    send are parsed once. `last` marks the final address of the frame header.
+    """
+    return Address.from_str(spec, a7_hldc=last)
+
+
+def _ui_frame(destination: str, source: str, path: list[str], info: bytes) -> Frame:
+    """Build a UI frame like Frame.ui(), but from cached Address objects."""
+    return Frame(
+        destination=_address(destination),
+        source=_address(source, not path),
+        path=[_address(p, p == path[-1]) for p in path],
+        info=info,
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _addressee_field(callsign: str) -> bytes:
+    """Return the APRS message addressee field for callsign, e.g. b":CALL-5   :"."""
+    return f":{callsign.ljust(9)}:".encode()
+
+
+@functools.lru_cache(maxsize=256)
+def _is_valid_callsign(callsign: str) -> bool:
+    """
+    Return True if callsign is 3-6 uppercase ASCII letters/digits, a dash, then 1-2 digits
+    (e.g. "5B4AON-9"). Cached, as the same few callsigns are validated on every send.
+    """
+    base, dash, ssid = callsign.partition("-")
+    return (
+        dash == "-"
+        and 3 <= len(base) <= 6
+        and 1 <= len(ssid) <= 2
+        and base.isascii()
+        and base.isalnum()
+        and base == base.upper()
+        and ssid.isascii()
+        and ssid.isdigit()
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _is_valid_path(path: tuple[Any, ...]) -> bool:
+    """
+    Return True if every path entry is a non-empty string. Keyed by tuple(path), as a
+    beacon sends with the same digipeater path every time.
+    """
+    return all(isinstance(p, str) and p for p in path)
+
+
 class AprsError(Exception):
     """Custom exception for APRS-related errors."""
     pass
@@ -125,7 +180,8 @@ class Aprs:
         self.kiss_protocol = None
         self.settings = None
         self.initialized = False
-        self._observers: dict[str, list[Callable[[Frame], None]]] = {}
+        # Callbacks per callsign, kept as dict keys: an insertion-ordered set with O(1) removal
+        self._observers: dict[str, dict[Callable[[Frame], None], None]] = {}
         self._run_task: Optional[asyncio.Task] = None
 
         if kiss is not None:
@@ -184,10 +240,7 @@ class Aprs:
             raise ValueError("mycall must be a non-empty string.")
         if not callable(callback):
             raise ValueError("callback must be callable.")
-        if mycall not in self._observers:
-            self._observers[mycall] = []
-        if callback not in self._observers[mycall]:
-            self._observers[mycall].append(callback)
+        self._observers.setdefault(mycall, {})[callback] = None
 
     def unregister_observer(
         self, mycall: str, callback: Optional[Callable[[Frame], None]] = None
@@ -199,16 +252,15 @@ class Aprs:
             mycall: The observer's callsign.
             callback: The callback function to remove. If None, remove all callbacks for this callsign.
         """
-        if mycall in self._observers:
-            if callback is None:
-                del self._observers[mycall]
-            else:
-                try:
-                    self._observers[mycall].remove(callback)
-                    if not self._observers[mycall]:
-                        del self._observers[mycall]
-                except ValueError:
-                    pass  # Callback not found; ignore
+        if callback is None:
+            self._observers.pop(mycall, None)
+            return
+        callbacks = self._observers.get(mycall)
+        if callbacks is None or callback not in callbacks:
+            return  # Callback not found; ignore
+        del callbacks[callback]
+        if not callbacks:
+            del self._observers[mycall]
 
     def clear_observers(self) -> None:
         """
@@ -224,17 +276,21 @@ class Aprs:
         Args:
             frame: The received frame.
         """
-        info = frame.info.decode("UTF-8")
+        observers = self._observers
+        if not observers:
+            return
+        info: bytes = frame.info
         logging.debug(frame)
-        for callsign, callbacks in self._observers.items():
-            logging.debug(f"Looking for callsign:{callsign}")
-            if f":{callsign.ljust(9)}:" in info:
-                logging.debug(f"Invoking callbacks for: {callsign}")
-                for callback in callbacks:
-                    try:
-                        callback(frame)
-                    except Exception as e:
-                        logging.error(f"Observer callback error for {callsign}: {e}")
+        # Snapshot both levels: a callback may unregister itself, dropping its callsign
+        for callsign, callbacks in tuple(observers.items()):
+            if _addressee_field(callsign) not in info:
+                continue
+            logging.debug("Invoking callbacks for: %s", callsign)
+            for callback in tuple(callbacks):
+                try:
+                    callback(frame)
+                except Exception as e:
+                    logging.error(f"Observer callback error for {callsign}: {e}")
 
     @staticmethod
     def get_my_message(callsign: str, frame: Frame) -> Optional[str]:
@@ -247,13 +303,16 @@ class Aprs:
         Returns:
             str: The message if found, otherwise None.
         """
-        info = frame.info.decode("UTF-8")
-        if f":{callsign}" in info:
-            message: str = info[info.index(f":{callsign}".ljust(10) + ":") + 11 :]
-            if "{" in message:
-                message = message[0 : message.index("{")]
-            return message.strip()
-        return None
+        info: bytes = frame.info
+        field = _addressee_field(callsign)
+        # The addressee field opens a message (offset 0); search only if it is not there,
+        # e.g. for third-party traffic
+        start = 0 if info.startswith(field) else info.find(field)
+        if start < 0:
+            return None
+        # Drop the optional "{id" message number; only the text is decoded
+        body = info[start + len(field) :].split(b"{", 1)[0]
+        return body.decode("UTF-8").strip()
 
     def send_my_message_no_ack(
         self, mycall: str, path: list[str], recipient: str, message: str
@@ -288,13 +347,13 @@ class Aprs:
             )
             raise ValueError("Message must be a non-empty string of 1 to 67 characters.")
 
-        info = f":{recipient}".ljust(10) + f":{message}"
+        info = _addressee_field(recipient) + message.encode("utf-8")
         try:
-            frame = Frame.ui(
+            frame = _ui_frame(
                 destination=self.APRS_SW_VERSION,
                 source=mycall,
                 path=path,
-                info=info.encode("utf-8"),
+                info=info,
             )
             if self.kiss_protocol is None:
                 raise AprsError("KISS protocol not initialized. Call connect() first.")
@@ -306,8 +365,7 @@ class Aprs:
 
     def _validate_callsign(self, callsign: str, param_name: str = "callsign") -> None:
         """Validate APRS callsign format."""
-        callsign_pattern = re.compile(r"^[A-Z0-9]{3,6}-\d{1,2}$")
-        if not callsign_pattern.match(callsign) or len(callsign) > 9:
+        if not isinstance(callsign, str) or not _is_valid_callsign(callsign):
             logging.error(
                 "%s must be 3-6 uppercase alphanumeric characters, a dash, then 1-2 digits (max 9 chars). Got: %r",
                 param_name,
@@ -319,7 +377,11 @@ class Aprs:
 
     def _validate_path(self, path: list[str]) -> None:
         """Validate APRS path format."""
-        if not isinstance(path, list) or not all(isinstance(p, str) and p for p in path):
+        try:
+            valid = isinstance(path, list) and _is_valid_path(tuple(path))
+        except TypeError:  # unhashable entry, so certainly not a string
+            valid = False
+        if not valid:
             logging.error("path must be a list of non-empty strings. Got: %r", path)
             raise ValueError("path must be a list of non-empty strings.")
 
@@ -446,7 +508,7 @@ class Aprs:
             f";{obj_name_padded}*{time_dhm}{lat_dmm}{symbol_id}{long_dmm}{symbol_code}{comment}"
         )
         try:
-            frame = Frame.ui(
+            frame = _ui_frame(
                 destination=self.APRS_SW_VERSION, # Typically APRS software version or generic ID
                 source=mycall,
                 path=path,
@@ -476,14 +538,14 @@ class Aprs:
                     ack = info[info.index("{") + 1 :].strip()
                     # Only take up to the next space or end of string
                     ack = ack.split()[0] if ack else ""
-                    ack_info = f":{frame.source}".ljust(10) + f":ack{ack}"
-                    logging.debug(f"Sending acknowledgment: {ack_info}")
+                    ack_info = _addressee_field(str(frame.source)) + b"ack" + ack.encode()
+                    logging.debug("Sending acknowledgment: %r", ack_info)
                     self.kiss_protocol.write(
-                        Frame.ui(
+                        _ui_frame(
                             destination="APDR16",
                             source=mycall,
                             path=path,
-                            info=ack_info.encode(),
+                            info=ack_info,
                         )
                     )
         except Exception as e:
@@ -569,7 +631,7 @@ class Aprs:
                 info = f"!{lat}{symbol_id}{lon}{symbol_code}{comment}"
 
         try:
-            frame = Frame.ui(
+            frame = _ui_frame(
                 destination=self.APRS_SW_VERSION,
                 source=mycall,
                 path=path,
@@ -645,7 +707,7 @@ class Aprs:
             info = f">{status}"
 
         try:
-            frame = Frame.ui(
+            frame = _ui_frame(
                 destination=self.APRS_SW_VERSION,
                 source=mycall,
                 path=path,
@@ -38,13 +38,16 @@ Usage example:
     data = gps.get_gps_data_dmm()
 """
 
-from typing import Optional, Protocol, Any, Tuple
+from typing import Optional, Protocol, Any, Tuple, Iterable
 from datetime import datetime
 import time
 from math import radians, degrees, sin, cos, asin, atan2
 
 __all__ = ["GPS", "GPSError", "GPSDInterface"]
 
+# Zero-padded bearing strings "000".."359", indexed by whole degree
+_BEARING_STRINGS = tuple(f"{deg:03d}" for deg in range(360))
+
 
 class GPSError(Exception):
     """Custom exception for GPS-related errors."""
@@ -215,15 +218,33 @@ class GPS:
         str
             The coordinate in DMM format with direction.
         """
-        degrees = int(abs(coord))
-        minutes = (abs(coord) - degrees) * 60
+        magnitude = abs(coord)
+        degrees = int(magnitude)
+        minutes = (magnitude - degrees) * 60
         if is_latitude:
-            dmm = f"{degrees:02d}{minutes:05.2f}"
-            direction = "N" if coord >= 0 else "S"
-        else:
-            dmm = f"{degrees:03d}{minutes:05.2f}"
-            direction = "E" if coord >= 0 else "W"
-        return f"{dmm}{direction}"
+            return f"{degrees:02d}{minutes:05.2f}{'N' if coord >= 0 else 'S'}"
+        return f"{degrees:03d}{minutes:05.2f}{'E' if coord >= 0 else 'W'}"
+
+    @staticmethod
+    def decimal_to_dmm_batch(coords: Iterable[float], is_latitude: bool = True) -> list[str]:
+        """
+        Converts many decimal degree coordinates to DMM format, e.g. a track log.
+
+        Equivalent to calling `decimal_to_dmm` on each value.
+
+        Parameters
+        ----------
+        coords : Iterable[float]
+            The coordinates in decimal degrees.
+        is_latitude : bool, optional
+            True if latitudes, False if longitudes (default is True).
+
+        Returns
+        -------
+        list[str]
+            The coordinates in DMM format with direction, in input order.
+        """
+        return [GPS.decimal_to_dmm(coord, is_latitude) for coord in coords]
 
     @staticmethod
     def iso_to_ddhhmmz(iso_time: str) -> str:
@@ -239,9 +260,46 @@ class GPS:
         -------
         str
             The time in DDHHMMz format.
+
+        Raises
+        ------
+        ValueError
+            If iso_time is not a valid "YYYY-MM-DDTHH:MM:SSZ" or
+            "YYYY-MM-DDTHH:MM:SS.ffffffZ" (1-6 fraction digits) timestamp.
         """
-        dt = datetime.strptime(iso_time, "%Y-%m-%dT%H:%M:%S.%fZ")
-        return dt.strftime("%d%H%Mz")
+        # Fixed-offset fields; gpsd always reports this layout, so skip strptime
+        digits = (
+            iso_time[0:4] + iso_time[5:7] + iso_time[8:10]
+            + iso_time[11:13] + iso_time[14:16] + iso_time[17:19]
+        )
+        tail = iso_time[19:]
+        fraction = tail[1:-1]
+        if not (
+            len(iso_time) >= 20
+            and iso_time[4] == "-" and iso_time[7] == "-" and iso_time[10] == "T"
+            and iso_time[13] == ":" and iso_time[16] == ":"
+            and digits.isascii() and digits.isdigit()
+            and (
+                tail == "Z"
+                or (
+                    tail[0] == "." and tail[-1] == "Z" and 1 <= len(fraction) <= 6
+                    and fraction.isascii() and fraction.isdigit()
+                )
+            )
+        ):
+            raise ValueError(f"Invalid ISO timestamp: {iso_time!r}")
+        # Let datetime apply the calendar rules; second 60 is a leap second, as in strptime
+        second = int(iso_time[17:19])
+        if second > 60:
+            raise ValueError(f"Invalid ISO timestamp: {iso_time!r}")
+        try:
+            datetime(
+                int(iso_time[0:4]), int(iso_time[5:7]), int(iso_time[8:10]),
+                int(iso_time[11:13]), int(iso_time[14:16]), min(second, 59),
+            )
+        except ValueError:
+            raise ValueError(f"Invalid ISO timestamp: {iso_time!r}") from None
+        return f"{iso_time[8:10]}{iso_time[11:13]}{iso_time[14:16]}z"
 
     @staticmethod
     def normalize_bearing(track: float) -> str:
@@ -258,8 +316,8 @@ class GPS:
         str
             The bearing as a zero-padded 3-digit string.
         """
-        bearing_int = int(round(track)) % 360
-        return f"{bearing_int:03d}"
+        # round() keeps Python's round-half-to-even (180.5 -> "180")
+        return _BEARING_STRINGS[round(track) % 360]
 
     @staticmethod
     def get_gps_target(
@@ -316,14 +374,19 @@ class GPS:
         lon_rad = radians(lon)
         bearing_rad = radians(bearing)
 
+        # Each term appears twice below; evaluate the trig once
+        angular_distance = distance_m / R
+        sin_lat, cos_lat = sin(lat_rad), cos(lat_rad)
+        sin_dist, cos_dist = sin(angular_distance), cos(angular_distance)
+
         target_lat_rad = asin(
-            sin(lat_rad) * cos(distance_m / R) +
-            cos(lat_rad) * sin(distance_m / R) * cos(bearing_rad)
+            sin_lat * cos_dist +
+            cos_lat * sin_dist * cos(bearing_rad)
         )
 
         target_lon_rad = lon_rad + atan2(
-            sin(bearing_rad) * sin(distance_m / R) * cos(lat_rad),
-            cos(distance_m / R) - sin(lat_rad) * sin(target_lat_rad)
+            sin(bearing_rad) * sin_dist * cos_lat,
+            cos_dist - sin_lat * sin(target_lat_rad)
         )
 
         target_lat = degrees(target_lat_rad)
@@ -12,6 +12,7 @@ Features:
 - Methods to move both tracks simultaneously for a specified duration or distance:
     - Synchronous: `move()` (supports optional acceleration smoothing and optional stop at end)
     - Asynchronous: `move_async()` (supports optional acceleration smoothing, interruption, and optional stop at end)
+    - `request_stop()` ends a running asynchronous move or turn early and stops the tracks (thread-safe)
     - You may specify either a duration (in seconds) or a distance (in centimeters) for the move.
     - If a distance is specified, the duration is automatically calculated using calibration parameters and the current/target speeds.
 - Methods to turn the rover along an arc or in place, specifying speed, turning radius, and direction:
@@ -81,6 +82,9 @@ Usage example:
     # Synchronous movement with acceleration smoothing (ramps to speed over 1s, holds, then stops)
     tracks.move(80, 80, duration=5, accel=80, accel_interval=0.1)
 
+    # Synchronous movement with a trapezoidal profile (ramp up, cruise, ramp down to a stop)
+    tracks.move(80, 80, duration=5, accel=80, profile="trapezoid")
+
     # Synchronous movement, but do not stop at end (leave tracks running)
     tracks.move(80, 80, duration=5, stop_at_end=False)
 
@@ -114,6 +118,12 @@ Usage example:
         # Asynchronous move for a distance
         await tracks.move_async(80, 80, distance_cm=150, accel=40)
 
+        # Asynchronous move ended early with the tracks stopped (e.g. from a sensor callback)
+        move_task = asyncio.create_task(tracks.move_async(60, 60, duration=10))
+        await asyncio.sleep(1)
+        tracks.request_stop()  # move_async returns normally, tracks are stopped
+        await move_task
+
         # Asynchronous turn: spin in place 90 degrees left
         await tracks.turn_async(70, 0, 'left', angle_deg=90)
 
@@ -130,13 +140,27 @@ This module is designed to be imported and used from other Python scripts.
 """
 
 import asyncio
+import functools
+import importlib
 import logging
 import math
+import threading
 import time
-from typing import Optional, Union, Protocol
+from typing import Any, Callable, Optional, Union, Protocol
 
 __all__ = ["Tracks", "TracksError", "PWMControllerInterface"]
 
+# PCA9685 registers used for combined left/right channel writes
+_PCA9685_MODE1 = 0x00
+_PCA9685_MODE1_AI = 0x20  # Register auto-increment
+_PCA9685_LED0_ON_L = 0x06  # Each channel occupies 4 registers from here
+
+_PI_OVER_360 = math.pi / 360  # Arc length per degree per cm of turning diameter
+
+# Motion profiles accepted by move() and move_async()
+_PROFILES = ("linear", "trapezoid", "scurve")
+_SCURVE_PEAK_RATIO = 4 / 3  # Peak / average acceleration of the constant-jerk S-curve
+
 
 class TracksError(Exception):
     """Custom exception for Tracks-related errors."""
@@ -149,11 +173,226 @@ class PWMControllerInterface(Protocol):
 
     Methods:
         set_pwm(channel: int, on: int, off: int): Set PWM value for a channel.
+
+    Controllers may also provide an optional
+    set_pwm_multi(writes: list[tuple[int, int, int]]) method that applies several
+    (channel, on, off) writes in one bus transaction; it is used when present.
     """
     def set_pwm(self, channel: int, on: int, off: int) -> None:
         ...
 
 
+def _track_speeds_for_turn(
+    speed: int, radius_cm: float, track_width_cm: float, left: bool
+) -> tuple[int, int]:
+    """
+    Compute left/right track speeds for a turn (pure differential drive kinematics).
+
+    Args:
+        speed: Overall speed (-100 to 100).
+        radius_cm: Turning radius in cm (0 = spin in place).
+        track_width_cm: Distance between tracks in cm.
+        left: True to turn left, False to turn right.
+
+    Returns:
+        (left_speed, right_speed): Tuple of speeds for each track.
+    """
+    if radius_cm == 0:
+        # Spin in place: one track forward, one reverse
+        return (-speed, speed) if left else (speed, -speed)
+    # Arc turn: inner track slows down, outer track speeds up
+    half_w = track_width_cm / 2
+    inner = int(round(speed * (radius_cm - half_w) / radius_cm))
+    outer = int(round(speed * (radius_cm + half_w) / radius_cm))
+    return (inner, outer) if left else (outer, inner)
+
+
+def _arc_length(radius_cm: float, angle_deg: float, track_width_cm: float) -> float:
+    """
+    Compute the distance travelled along a turn.
+
+    Args:
+        radius_cm: Turning radius in cm (0 = spin in place, tracks move on a circle
+            with diameter equal to the track width).
+        angle_deg: Angle to turn in degrees.
+        track_width_cm: Distance between tracks in cm.
+
+    Returns:
+        Arc length in cm.
+    """
+    diameter = track_width_cm if radius_cm == 0 else 2 * radius_cm
+    return diameter * angle_deg * _PI_OVER_360
+
+
+@functools.lru_cache(maxsize=256)
+def _turn_duration(
+    cm_per_sec: float, radius_cm: float, angle_deg: float, track_width_cm: float
+) -> float:
+    """
+    Compute the unclamped duration of a turn at constant speed.
+
+    Results are memoized, since navigation code tends to repeat the same maneuvers.
+
+    Args:
+        cm_per_sec: Speed along the arc in cm/s (must be non-zero).
+        radius_cm: Turning radius in cm (0 = spin in place).
+        angle_deg: Angle to turn in degrees.
+        track_width_cm: Distance between tracks in cm.
+
+    Returns:
+        Duration in seconds.
+    """
+    return _arc_length(radius_cm, angle_deg, track_width_cm) / cm_per_sec
+
+
+@functools.lru_cache(maxsize=128)
+def _ramp_schedule(
+    left_start: int, left_target: int, right_start: int, right_target: int, steps: int
+) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """
+    Compute the per-step track speeds of a linear acceleration ramp.
+
+    Args:
+        left_start: Starting speed for the left track (-100 to 100).
+        left_target: Target speed for the left track (-100 to 100).
+        right_start: Starting speed for the right track (-100 to 100).
+        right_target: Target speed for the right track (-100 to 100).
+        steps: Number of ramp steps (>= 1); the last step reaches the targets.
+
+    Returns:
+        (left_schedule, right_schedule): Tuples of `steps` integer speeds each. Results
+        are cached, since rovers tend to repeat the same ramps (e.g. 0 to cruise speed).
+    """
+    def schedule(start: int, target: int) -> tuple[int, ...]:
+        # Bresenham-style accumulation of start + delta * k / steps, rounded half away
+        # from zero: the accumulator starts at half a step (steps / 2, doubled to stay
+        # integral) and every overflow of a full step advances the speed by one
+        delta = target - start
+        sign = 1 if delta >= 0 else -1
+        twice_abs, twice_steps = 2 * abs(delta), 2 * steps
+        current, acc = start, steps
+        result = []
+        for _ in range(steps):
+            acc += twice_abs
+            while acc >= twice_steps:
+                current += sign
+                acc -= twice_steps
+            result.append(current)
+        return tuple(result)
+
+    return schedule(left_start, left_target), schedule(right_start, right_target)
+
+
+@functools.lru_cache(maxsize=128)
+def _scurve_schedule(
+    left_start: int, left_target: int, right_start: int, right_target: int, steps: int
+) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """
+    Compute the per-step track speeds of a constant-jerk S-curve acceleration ramp.
+
+    Each ramp has three phases: the acceleration builds up at constant jerk over the
+    first quarter, holds over the middle half, and tapers off at constant jerk over the
+    last quarter. Together with the cruise and the mirrored ramp down, a move follows
+    the classic 7-phase S-curve. The peak acceleration is 4/3 of a linear ramp's over
+    the same number of steps.
+
+    Args:
+        left_start: Starting speed for the left track (-100 to 100).
+        left_target: Target speed for the left track (-100 to 100).
+        right_start: Starting speed for the right track (-100 to 100).
+        right_target: Target speed for the right track (-100 to 100).
+        steps: Number of ramp steps (>= 1); the last step reaches the targets.
+
+    Returns:
+        (left_schedule, right_schedule): Tuples of `steps` integer speeds each.
+    """
+    # Ramp fraction reached after step k, as a numerator over 6 * steps^2
+    n = steps
+    denominator = 6 * n * n
+    fractions = tuple(
+        16 * k * k if 4 * k <= n  # Jerk phase: acceleration builds up
+        else denominator - 16 * (n - k) ** 2 if 4 * k >= 3 * n  # Jerk phase: tapers off
+        else n * (8 * k - n)  # Constant acceleration
+        for k in range(1, n + 1)
+    )
+
+    def schedule(start: int, target: int) -> tuple[int, ...]:
+        # delta * fraction rounded half away from zero, in integer arithmetic
+        delta = target - start
+        sign = 1 if delta >= 0 else -1
+        twice_abs = 2 * abs(delta)
+        return tuple(
+            start + sign * ((twice_abs * f + denominator) // (2 * denominator))
+            for f in fractions
+        )
+
+    return schedule(left_start, left_target), schedule(right_start, right_target)
+
+
+def _scale_speed(speed: int, numerator: int, denominator: int) -> int:
+    """
+    Scale a track speed by numerator / denominator, rounded half away from zero.
+
+    Args:
+        speed: Track speed (-100 to 100).
+        numerator: Scale numerator (>= 0).
+        denominator: Scale denominator (> 0).
+
+    Returns:
+        The scaled integer speed.
+    """
+    scaled = (2 * abs(speed) * numerator + denominator) // (2 * denominator)
+    return scaled if speed >= 0 else -scaled
+
+
+def _profile_samples(
+    left_start: int,
+    left_target: int,
+    right_start: int,
+    right_target: int,
+    up_steps: int,
+    down_steps: int,
+    total_steps: int,
+    profile: str,
+) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """
+    Compute the per-step track speeds of a move for the given motion profile.
+
+    - "linear": linear ramp to the targets; the caller holds them for the rest of the move.
+    - "trapezoid": linear ramp up, cruise at the targets, linear ramp down to zero.
+    - "scurve": like "trapezoid", with constant-jerk S-curve ramps.
+
+    Args:
+        left_start: Starting speed for the left track (-100 to 100).
+        left_target: Target speed for the left track (-100 to 100).
+        right_start: Starting speed for the right track (-100 to 100).
+        right_target: Target speed for the right track (-100 to 100).
+        up_steps: Number of steps of the ramp to the targets (may be 0).
+        down_steps: Number of steps of the ramp down to zero (ignored for "linear").
+        total_steps: Number of steps in the whole move (>= up_steps + down_steps).
+        profile: One of "linear", "trapezoid" or "scurve".
+
+    Returns:
+        (left_schedule, right_schedule): Tuples of integer speeds, one per step.
+    """
+    ramp = _scurve_schedule if profile == "scurve" else _ramp_schedule
+    left_up: tuple[int, ...] = ()
+    right_up: tuple[int, ...] = ()
+    if up_steps:
+        left_up, right_up = ramp(left_start, left_target, right_start, right_target, up_steps)
+    if profile == "linear":
+        return left_up, right_up
+    left_down: tuple[int, ...] = ()
+    right_down: tuple[int, ...] = ()
+    if down_steps:
+        left_down, right_down = ramp(left_target, 0, right_target, 0, down_steps)
+    cruise = total_steps - up_steps - down_steps
+    return (
+        left_up + (left_target,) * cruise + left_down,
+        right_up + (right_target,) * cruise + right_down,
+    )
+
+
 class Tracks:
     """
     Controls the left and right tracks of a rover using a PWM controller.
@@ -181,6 +420,9 @@ class Tracks:
     DEFAULT_BASE_DISTANCE: float = 30.0  # Calibration base distance in centimeters
     DEFAULT_BASE_DURATION: float = 3.5   # Calibration base duration in seconds
 
+    # Adafruit_PCA9685 module, imported lazily when no PWM controller is injected
+    _pca_module: Any = None
+
     def __init__(self, pwm: Optional[PWMControllerInterface] = None) -> None:
         """
         Initialize the Tracks controller.
@@ -195,8 +437,11 @@ class Tracks:
             self.pwm = pwm
         else:
             try:
-                import Adafruit_PCA9685
-                self.pwm = Adafruit_PCA9685.PCA9685()
+                # Import the hardware driver on first use only, then reuse the module
+                cls = type(self)
+                if cls._pca_module is None:
+                    cls._pca_module = importlib.import_module("Adafruit_PCA9685")
+                self.pwm = cls._pca_module.PCA9685()
             except ImportError as e:
                 raise TracksError("Adafruit_PCA9685 not available and no PWM controller provided.") from e
 
@@ -218,6 +463,26 @@ class Tracks:
         self.base_distance: float = self.DEFAULT_BASE_DISTANCE
         self.base_duration: float = self.DEFAULT_BASE_DURATION
 
+        # Last commanded track speeds
+        self._left_track_speed: int = 0
+        self._right_track_speed: int = 0
+
+        # PWM lookup tables, rebuilt lazily when the PWM calibration attributes change
+        self._pwm_table_key: Optional[tuple[int, int, int, int, int]] = None
+        self._pwm_signed_table: tuple[int, ...] = ()
+        # Last (channel, PWM value) written per track, used to skip redundant bus writes
+        self._last_left_pwm: Optional[tuple[int, int]] = None
+        self._last_right_pwm: Optional[tuple[int, int]] = None
+        # Controller bulk-write hook or raw I2C device of the PCA9685, if exposed,
+        # for combined two-channel writes
+        self._pwm_bulk: Optional[Callable[[list[tuple[int, int, int]]], None]] = None
+        self._pwm_device: Optional[Any] = None
+        # Cooperative stop of a running async move, see request_stop(). Both fields are
+        # only changed together under _move_lock, as request_stop() may run in any thread
+        self._move_lock = threading.Lock()
+        self._cancel_move: bool = False
+        self._move_finish: Optional[tuple[asyncio.AbstractEventLoop, Callable[[], None]]] = None
+
         self.initialized = False
         self.init()
 
@@ -231,12 +496,35 @@ class Tracks:
         try:
             if hasattr(self.pwm, "set_pwm_freq"):
                 self.pwm.set_pwm_freq(50)
+            # The controller state is unknown after (re)initialization
+            self._last_left_pwm = None
+            self._last_right_pwm = None
+            bulk = getattr(self.pwm, "set_pwm_multi", None)
+            self._pwm_bulk = bulk if callable(bulk) else None
+            self._pwm_device = None if self._pwm_bulk else self._detect_pwm_device()
             self.initialized = True
         except Exception as e:
             self.initialized = False
             logging.error("Failed to initialize PWM controller: %s", e)
             raise TracksError(f"Failed to initialize PWM controller: {e}")
 
+    def _detect_pwm_device(self) -> Optional[Any]:
+        """
+        Find the raw I2C device behind an Adafruit PCA9685 controller.
+
+        If found, register auto-increment is enabled so that both track channels
+        can be written in a single I2C block transfer.
+
+        Returns:
+            The raw I2C device, or None if the controller does not expose one.
+        """
+        device = getattr(self.pwm, "_device", None)
+        if device is None or not all(hasattr(device, m) for m in ("writeList", "readU8", "write8")):
+            return None
+        mode1 = device.readU8(_PCA9685_MODE1)
+        device.write8(_PCA9685_MODE1, mode1 | _PCA9685_MODE1_AI)
+        return device
+
     def sanitize_speed(self, speed: Union[int, float, str]) -> int:
         """
         Convert speed to int and clamp to [-100, 100].
@@ -247,16 +535,20 @@ class Tracks:
         Returns:
             int: Sanitized speed value in range [-100, 100].
         """
-        try:
-            x = int(float(speed))
-        except (ValueError, TypeError):
-            logging.error(f"Could not convert speed value '{speed}' to integer.")
-            x = 0
+        # Fast path: native ints need no conversion (type() check excludes bool)
+        if type(speed) is int:
+            if -100 <= speed <= 100:
+                return speed
+            x = speed
+        else:
+            try:
+                x = int(float(speed))
+            except (ValueError, TypeError):
+                logging.error("Could not convert speed value '%s' to integer.", speed)
+                x = 0
         if x < -100 or x > 100:
-            logging.warning(
-                f"Speed value {x} out of bounds [-100, 100]; clamping to limits."
-            )
-        return max(-100, min(100, x))
+            logging.warning("Speed value %s out of bounds [-100, 100]; clamping to limits.", x)
+        return -100 if x < -100 else (100 if x > 100 else x)
 
     def get_pwm_fw_speed(self, speed: Union[int, float, str] = 0) -> int:
         """
@@ -269,13 +561,8 @@ class Tracks:
             int: PWM value for forward motion.
         """
         x = self.sanitize_speed(speed)
-        x = max(0, min(100, x))  # Only allow 0-100 for forward
-        if x > 99:
-            return self.pwm_fw_max
-        elif x < 1:
-            return self.pwm_stop
-        else:
-            return self.pwm_fw_min - round((x * 90) / 100)
+        # Only allow 0-100 for forward; sanitize_speed already caps at 100
+        return self._pwm_table()[100 + x if x > 0 else 100]
 
     def get_pwm_rev_speed(self, speed: Union[int, float, str] = 0) -> int:
         """
@@ -288,13 +575,35 @@ class Tracks:
             int: PWM value for reverse motion.
         """
         x = self.sanitize_speed(speed)
-        x = max(0, min(100, x))  # Only allow 0-100 for reverse
-        if x > 99:
-            return self.pwm_rev_max
-        elif x < 1:
-            return self.pwm_stop
-        else:
-            return self.pwm_rev_min + round((x * 90) / 100)
+        # Only allow 0-100 for reverse; sanitize_speed already caps at 100
+        return self._pwm_table()[100 - x if x > 0 else 100]
+
+    def _pwm_table(self) -> tuple[int, ...]:
+        """
+        Get the signed PWM lookup table, indexed by `speed + 100` for speeds -100 to 100.
+
+        Negative speeds map to reverse PWM values and positive speeds to forward
+        PWM values. The table is computed once and rebuilt only when one of the PWM
+        calibration attributes (`pwm_fw_min`, `pwm_fw_max`, `pwm_stop`,
+        `pwm_rev_min`, `pwm_rev_max`) has changed since the last call.
+
+        Returns:
+            Tuple of 201 PWM values.
+        """
+        key = (self.pwm_fw_min, self.pwm_fw_max, self.pwm_stop, self.pwm_rev_min, self.pwm_rev_max)
+        if key != self._pwm_table_key:
+            fw_min, fw_max, stop, rev_min, rev_max = key
+            fw = [
+                fw_max if x > 99 else stop if x < 1 else fw_min - round((x * 90) / 100)
+                for x in range(101)
+            ]
+            rev = [
+                rev_max if x > 99 else stop if x < 1 else rev_min + round((x * 90) / 100)
+                for x in range(101)
+            ]
+            self._pwm_signed_table = tuple(rev[:0:-1] + fw)
+            self._pwm_table_key = key
+        return self._pwm_signed_table
 
     def get_left_track_speed(self) -> int:
         """
@@ -303,7 +612,7 @@ class Tracks:
         Returns:
             int: The last commanded speed for the left track (-100 to 100).
         """
-        return getattr(self, "_left_track_speed", 0)
+        return self._left_track_speed
 
     def get_right_track_speed(self) -> int:
         """
@@ -312,7 +621,7 @@ class Tracks:
         Returns:
             int: The last commanded speed for the right track (-100 to 100).
         """
-        return getattr(self, "_right_track_speed", 0)
+        return self._right_track_speed
 
     def set_left_track_speed(self, left_track_speed: Union[int, float, str] = 0) -> None:
         """
@@ -325,19 +634,8 @@ class Tracks:
             TracksError: If setting the PWM value fails.
         """
         x = self.sanitize_speed(left_track_speed)
-        self._left_track_speed = x  # Track the last commanded speed
         try:
-            if self.left_channel_reverse:
-                # Invert the logic for reversed channel
-                if x < 0:
-                    self.pwm.set_pwm(self.left_channel, 0, self.get_pwm_fw_speed(-x))
-                else:
-                    self.pwm.set_pwm(self.left_channel, 0, self.get_pwm_rev_speed(x))
-            else:
-                if x < 0:
-                    self.pwm.set_pwm(self.left_channel, 0, self.get_pwm_rev_speed(-x))
-                else:
-                    self.pwm.set_pwm(self.left_channel, 0, self.get_pwm_fw_speed(x))
+            self._set_left_pwm(x)
         except Exception as e:
             logging.error("Failed to set left track PWM: %s", e)
             raise TracksError(f"Failed to set left track PWM: {e}")
@@ -353,23 +651,97 @@ class Tracks:
             TracksError: If setting the PWM value fails.
         """
         x = self.sanitize_speed(right_track_speed)
-        self._right_track_speed = x  # Track the last commanded speed
         try:
-            if self.right_channel_reverse:
-                # Invert the logic for reversed channel
-                if x < 0:
-                    self.pwm.set_pwm(self.right_channel, 0, self.get_pwm_fw_speed(-x))
-                else:
-                    self.pwm.set_pwm(self.right_channel, 0, self.get_pwm_rev_speed(x))
-            else:
-                if x < 0:
-                    self.pwm.set_pwm(self.right_channel, 0, self.get_pwm_rev_speed(-x))
-                else:
-                    self.pwm.set_pwm(self.right_channel, 0, self.get_pwm_fw_speed(x))
+            self._set_right_pwm(x)
         except Exception as e:
             logging.error("Failed to set right track PWM: %s", e)
             raise TracksError(f"Failed to set right track PWM: {e}")
 
+    def _pwm_for_speed(self, speed: int, reverse: bool) -> int:
+        """
+        Look up the PWM value for an already-sanitized speed.
+
+        Args:
+            speed: Speed value (-100 to 100).
+            reverse: Whether the channel direction is reversed.
+
+        Returns:
+            int: PWM value for the channel.
+        """
+        # Invert the logic for reversed channel
+        return self._pwm_table()[100 - speed if reverse else 100 + speed]
+
+    def _set_left_pwm(self, x: int) -> None:
+        """
+        Record and write an already-sanitized left track speed.
+
+        The PWM write is skipped if the channel already holds the same value.
+
+        Args:
+            x: Speed for the left track (-100 to 100).
+        """
+        self._left_track_speed = x  # Track the last commanded speed
+        last = (self.left_channel, self._pwm_for_speed(x, self.left_channel_reverse))
+        if last != self._last_left_pwm:
+            self.pwm.set_pwm(last[0], 0, last[1])
+            self._last_left_pwm = last
+
+    def _set_right_pwm(self, x: int) -> None:
+        """
+        Record and write an already-sanitized right track speed.
+
+        The PWM write is skipped if the channel already holds the same value.
+
+        Args:
+            x: Speed for the right track (-100 to 100).
+        """
+        self._right_track_speed = x  # Track the last commanded speed
+        last = (self.right_channel, self._pwm_for_speed(x, self.right_channel_reverse))
+        if last != self._last_right_pwm:
+            self.pwm.set_pwm(last[0], 0, last[1])
+            self._last_right_pwm = last
+
+    def _write_pwm(self, left: int, right: int) -> None:
+        """
+        Write already-sanitized speeds to both tracks.
+
+        Used by the acceleration ramp, whose speeds are clamped integers by
+        construction, so validation and clamping are skipped.
+
+        If both values changed, both channels are written in one transaction, either
+        through the controller's set_pwm_multi() or, for adjacent channels of a PCA9685
+        that exposes its I2C device, as one block transfer.
+
+        Args:
+            left: Speed for the left track (-100 to 100).
+            right: Speed for the right track (-100 to 100).
+        """
+        bulk = self._pwm_bulk
+        device = self._pwm_device if abs(self.left_channel - self.right_channel) == 1 else None
+        if bulk is None and device is None:
+            self._set_left_pwm(left)
+            self._set_right_pwm(right)
+            return
+        new_left = (self.left_channel, self._pwm_for_speed(left, self.left_channel_reverse))
+        new_right = (self.right_channel, self._pwm_for_speed(right, self.right_channel_reverse))
+        if new_left == self._last_left_pwm or new_right == self._last_right_pwm:
+            # At most one channel changes, a single-channel write is enough
+            self._set_left_pwm(left)
+            self._set_right_pwm(right)
+            return
+        self._left_track_speed = left
+        self._right_track_speed = right
+        if bulk is not None:
+            bulk([(new_left[0], 0, new_left[1]), (new_right[0], 0, new_right[1])])
+        elif device is not None:
+            (low_ch, low_off), (_, high_off) = sorted((new_left, new_right))
+            device.writeList(
+                _PCA9685_LED0_ON_L + 4 * low_ch,
+                [0, 0, low_off & 0xFF, low_off >> 8, 0, 0, high_off & 0xFF, high_off >> 8],
+            )
+        self._last_left_pwm = new_left
+        self._last_right_pwm = new_right
+
     def sanitize_duration(self, duration: float) -> float:
         """
         Validate and clamp the duration for movement.
@@ -383,15 +755,18 @@ class Tracks:
         Raises:
             TracksError: If duration is not a positive float or cannot be converted.
         """
-        try:
-            d = float(duration)
-        except (ValueError, TypeError):
-            logging.error(f"Could not convert duration value '{duration}' to float.")
-            raise TracksError("Duration must be a number.")
+        if type(duration) is float:
+            d = duration
+        else:
+            try:
+                d = float(duration)
+            except (ValueError, TypeError):
+                logging.error("Could not convert duration value '%s' to float.", duration)
+                raise TracksError("Duration must be a number.")
         if d <= 0 or d > self.move_duration_max:
             logging.warning(
-                f"Duration value {d} out of bounds (0, {self.move_duration_max}]; "
-                f"clamping to limits."
+                "Duration value %s out of bounds (0, %s]; clamping to limits.",
+                d, self.move_duration_max,
             )
         # Clamp to valid range (0, move_duration_max]
         d_clamped = min(max(d, 0.01), self.move_duration_max)
@@ -432,8 +807,8 @@ class Tracks:
         duration = max(0.1, min(float(self.move_duration_max), float(duration)))
         if duration != orig_duration:
             logging.warning(
-                f"Move duration {orig_duration:.2f}s clamped to {duration:.2f}s "
-                f"(limits: 0.1s to {self.move_duration_max}s)."
+                "Move duration %.2fs clamped to %.2fs (limits: 0.1s to %ss).",
+                orig_duration, duration, self.move_duration_max,
             )
         return duration
 
@@ -445,6 +820,7 @@ class Tracks:
         right_target: int,
         distance_cm: float,
         accel: float,
+        decel_to_stop: bool = False,
     ) -> float:
         """
         Calculate duration needed to move a given distance with acceleration from start to target speeds.
@@ -456,6 +832,8 @@ class Tracks:
             right_target: Target speed for the right track (-100 to 100).
             distance_cm: Distance to move in centimeters.
             accel: Acceleration in percent per second.
+            decel_to_stop: If True, the move ends with a deceleration to a stop at the same rate.
+                If the tracks cannot stop within the distance, the move is just that deceleration.
 
         Returns:
             Duration in seconds, clamped to [0.1, move_duration_max].
@@ -484,7 +862,21 @@ class Tracks:
         if accel_cms2 > 0:
             t_accel = abs(v1 - v0) / accel_cms2
             d_accel = (v0 + v1) / 2 * t_accel
-            if d_accel >= distance_cm:
+            t_decel = v1 / accel_cms2 if decel_to_stop else 0
+            d_decel = v1 / 2 * t_decel
+            if decel_to_stop and v0**2 / (2 * accel_cms2) >= distance_cm:
+                # Already too fast to stop within the distance: decelerate to a stop at once
+                duration = v0 / accel_cms2
+                logging.warning(
+                    "Stopping from the current speed takes %.2fcm, more than the %.2fcm requested.",
+                    v0**2 / (2 * accel_cms2), distance_cm,
+                )
+            elif decel_to_stop and d_accel + d_decel >= distance_cm:
+                # Too short to cruise: accelerate to a peak speed, then decelerate to a stop.
+                # distance = (v_peak^2 - v0^2) / 2a + v_peak^2 / 2a
+                v_peak = math.sqrt(accel_cms2 * distance_cm + v0**2 / 2)
+                duration = (abs(v_peak - v0) + v_peak) / accel_cms2
+            elif d_accel >= distance_cm:
                 # The distance is too short to reach target speed; solve quadratic:
                 # s = v0*t + 0.5*a*t^2  => 0.5*a*t^2 + v0*t - distance_cm = 0
                 a = 0.5 * accel_cms2
@@ -496,10 +888,10 @@ class Tracks:
                 t = (-b + math.sqrt(discriminant)) / (2*a)
                 duration = t
             else:
-                # Accelerate to target speed, then continue at constant speed
-                d_const = max(0, distance_cm - d_accel)
+                # Accelerate to target speed, continue at constant speed (then decelerate)
+                d_const = max(0, distance_cm - d_accel - d_decel)
                 t_const = d_const / v1 if v1 > 0 else 0
-                duration = t_accel + t_const
+                duration = t_accel + t_const + t_decel
         else:
             # No acceleration, just use constant speed
             duration = distance_cm / v1 if v1 > 0 else 0
@@ -508,8 +900,8 @@ class Tracks:
         duration = max(0.1, min(float(self.move_duration_max), float(duration)))
         if duration != orig_duration:
             logging.warning(
-                f"Move duration {orig_duration:.2f}s clamped to {duration:.2f}s "
-                f"(limits: 0.1s to {self.move_duration_max}s)."
+                "Move duration %.2fs clamped to %.2fs (limits: 0.1s to %ss).",
+                orig_duration, duration, self.move_duration_max,
             )
         return duration
 
@@ -522,6 +914,7 @@ class Tracks:
         accel: Optional[float] = None,
         accel_interval: float = 0.05,
         stop_at_end: bool = True,
+        profile: str = "linear",
     ) -> None:
         """
         Move both tracks at specified speeds for a given duration or distance, with optional acceleration smoothing.
@@ -537,6 +930,11 @@ class Tracks:
                    If None or <= 0, jumps instantly to target speed.
             accel_interval: Time step for acceleration smoothing in seconds.
             stop_at_end: If True (default), stop both tracks at the end. If False, leave tracks running.
+            profile: Acceleration profile used when accel is set. "linear" (default) ramps to the
+                   target speeds and holds them. "trapezoid" also ramps down to a stop at the end
+                   of the move, and "scurve" does the same with constant-jerk S-curve ramps
+                   whose peak acceleration is `accel`. Moves too short to reach the target
+                   speeds peak at lower speeds instead of exceeding `accel`.
 
         Raises:
             TracksError: If neither or both of duration and distance_cm are provided, or if parameters are invalid.
@@ -544,100 +942,16 @@ class Tracks:
         Examples:
             tracks.move(80, 80, duration=5, accel=80, accel_interval=0.1)
             tracks.move(80, 80, distance_cm=100)
+            tracks.move(80, 80, duration=5, accel=80, profile="trapezoid")
         """
-        if (duration is None and distance_cm is None) or (duration is not None and distance_cm is not None):
-            raise TracksError("Exactly one of duration or distance_cm must be provided.")
-
-        left_target = self.sanitize_speed(left_track_speed)
-        right_target = self.sanitize_speed(right_track_speed)
-
-        # Calculate duration if distance_cm is given
-        if distance_cm is not None:
-            if accel is not None and accel > 0:
-                left_start = self.get_left_track_speed()
-                right_start = self.get_right_track_speed()
-                duration_val = self._move_duration_with_accel(
-                    left_start, right_start, left_target, right_target, float(distance_cm), float(accel)
-                )
-            else:
-                duration_val = self._move_duration(left_target, right_target, float(distance_cm))
-        else:
-            duration_val = self.sanitize_duration(duration)
-
-        # Clamp duration to [0.1, move_duration_max]
-        orig_duration = duration_val
-        duration_val = max(0.1, min(float(self.move_duration_max), float(duration_val)))
-        if duration_val != orig_duration:
-            logging.warning(
-                f"Move duration {orig_duration:.2f}s clamped to {duration_val:.2f}s "
-                f"(limits: 0.1s to {self.move_duration_max}s)."
-            )
-
-        # Validate accel and accel_interval
-        if accel is not None:
-            try:
-                accel_val = float(accel)
-            except (ValueError, TypeError):
-                raise TracksError("Acceleration (accel) must be a number or None.")
-            if accel_val < 0 or accel_val > 1000:
-                raise TracksError("Acceleration (accel) must be between 0 and 1000 percent per second.")
-        else:
-            accel_val = None
-
-        try:
-            accel_interval_val = float(accel_interval)
-        except (ValueError, TypeError):
-            raise TracksError("Acceleration interval (accel_interval) must be a positive float.")
-        if accel_interval_val <= 0 or accel_interval_val > duration_val:
-            raise TracksError("Acceleration interval (accel_interval) must be > 0 and <= duration.")
-
-        # Use current speeds as starting point for ramping
-        left_start = self.get_left_track_speed()
-        right_start = self.get_right_track_speed()
-
-        try:
-            if accel_val is None or accel_val <= 0:
-                # No smoothing, jump to target
-                logging.debug(f"Jumping to target speeds: left={left_target}, right={right_target}, for={duration_val:03.2f} seconds")
-                self.set_left_track_speed(left_target)
-                self.set_right_track_speed(right_target)
-                time.sleep(duration_val)
-            else:
-                # Smooth acceleration from current speed to target speed
-                logging.debug(f"Smoothly accelerating to target speeds: left={left_target}, right={right_target}, for={duration_val:03.2f} seconds with accel={accel_val}%")
-                import math
-                left_delta = left_target - left_start
-                right_delta = right_target - right_start
-                steps_left = (
-                    math.ceil(abs(left_delta) / (accel_val * accel_interval_val))
-                    if accel_val > 0 and left_delta != 0 else 1
-                )
-                steps_right = (
-                    math.ceil(abs(right_delta) / (accel_val * accel_interval_val))
-                    if accel_val > 0 and right_delta != 0 else 1
-                )
-                steps = max(1, int(max(steps_left, steps_right)))
-                total_steps = max(1, int(duration_val / accel_interval_val))
-                steps = min(steps, total_steps)
-                for i in range(steps):
-                    frac = (i + 1) / steps
-                    left = round(left_start + (left_target - left_start) * frac)
-                    right = round(right_start + (right_target - right_start) * frac)
-                    self.set_left_track_speed(left)
-                    self.set_right_track_speed(right)
-                    time.sleep(accel_interval_val)
-                # Hold at target for the remainder
-                remaining = duration_val - steps * accel_interval_val
-                if remaining > 0:
-                    self.set_left_track_speed(left_target)
-                    self.set_right_track_speed(right_target)
-                    time.sleep(remaining)
-            if stop_at_end:
-                self.stop()
-        except Exception as e:
-            self.stop()
-            logging.error("Failed to move tracks: %s", e)
-            raise TracksError(f"Failed to move tracks: {e}")
+        self._move_validated(
+            *self._validate_move_args(
+                left_track_speed, right_track_speed, duration, distance_cm, accel, accel_interval,
+                profile,
+            ),
+            stop_at_end,
+            profile,
+        )
 
     async def move_async(
         self,
@@ -648,6 +962,7 @@ class Tracks:
         accel: Optional[float] = None,
         accel_interval: float = 0.05,
         stop_at_end: bool = True,
+        profile: str = "linear",
     ) -> None:
         """
         Asynchronously move both tracks at specified speeds for a given duration or distance,
@@ -657,7 +972,8 @@ class Tracks:
 
         This method can be cancelled (e.g., via asyncio.Task.cancel()), but will only stop the tracks
         if the duration completes or an exception occurs. If cancelled, the tracks will continue
-        running at the last set speed.
+        running at the last set speed. To end the move early with the tracks stopped, call
+        request_stop() instead; the move then returns normally.
 
         Args:
             left_track_speed: Target speed for the left track (-100 to 100, zero allowed for stopping).
@@ -668,6 +984,11 @@ class Tracks:
                    If None, jumps instantly to target speed.
             accel_interval: Time step for acceleration smoothing in seconds.
             stop_at_end: If True (default), stop both tracks at the end. If False, leave tracks running.
+            profile: Acceleration profile used when accel is set. "linear" (default) ramps to the
+                   target speeds and holds them. "trapezoid" also ramps down to a stop at the end
+                   of the move, and "scurve" does the same with constant-jerk S-curve ramps
+                   whose peak acceleration is `accel`. Moves too short to reach the target
+                   speeds peak at lower speeds instead of exceeding `accel`.
 
         Raises:
             TracksError: If neither or both of duration and distance_cm are provided, or if parameters are invalid.
@@ -677,8 +998,48 @@ class Tracks:
             await tracks.move_async(80, 80, distance_cm=100, accel=40)
             await tracks.move_async(80, 80, duration=5, stop_at_end=False)
         """
+        await self._move_validated_async(
+            *self._validate_move_args(
+                left_track_speed, right_track_speed, duration, distance_cm, accel, accel_interval,
+                profile,
+            ),
+            stop_at_end,
+            profile,
+        )
+
+    def _validate_move_args(
+        self,
+        left_track_speed: Union[int, float, str],
+        right_track_speed: Union[int, float, str],
+        duration: Optional[float],
+        distance_cm: Optional[float],
+        accel: Optional[float],
+        accel_interval: float,
+        profile: str = "linear",
+    ) -> tuple[int, int, float, Optional[float], float]:
+        """
+        Validate the arguments shared by `move()` and `move_async()`.
+
+        Args:
+            left_track_speed: Speed for the left track (-100 to 100).
+            right_track_speed: Speed for the right track (-100 to 100).
+            duration: Duration in seconds, or None if distance_cm is given.
+            distance_cm: Distance to travel in centimeters, or None if duration is given.
+            accel: Optional acceleration in percent per second.
+            accel_interval: Time step for acceleration smoothing in seconds.
+            profile: Motion profile, one of "linear", "trapezoid" or "scurve".
+
+        Returns:
+            (left_target, right_target, duration, accel, accel_interval): Validated values.
+
+        Raises:
+            TracksError: If neither or both of duration and distance_cm are provided,
+                or if parameters are invalid.
+        """
         if (duration is None and distance_cm is None) or (duration is not None and distance_cm is not None):
             raise TracksError("Exactly one of duration or distance_cm must be provided.")
+        if profile not in _PROFILES:
+            raise TracksError(f"Motion profile must be one of {', '.join(_PROFILES)}.")
 
         left_target = self.sanitize_speed(left_track_speed)
         right_target = self.sanitize_speed(right_track_speed)
@@ -688,23 +1049,57 @@ class Tracks:
             if accel is not None and accel > 0:
                 left_start = self.get_left_track_speed()
                 right_start = self.get_right_track_speed()
+                # An S-curve reaches its speed at 3/4 of the peak acceleration on average
+                accel_avg = float(accel) / _SCURVE_PEAK_RATIO if profile == "scurve" else float(accel)
                 duration_val = self._move_duration_with_accel(
-                    left_start, right_start, left_target, right_target, float(distance_cm), float(accel)
+                    left_start, right_start, left_target, right_target, float(distance_cm), accel_avg,
+                    decel_to_stop=profile != "linear",
                 )
             else:
                 duration_val = self._move_duration(left_target, right_target, float(distance_cm))
         else:
             duration_val = self.sanitize_duration(duration)
 
+        duration_val, accel_val, accel_interval_val = self._validate_motion_params(
+            duration_val, accel, accel_interval
+        )
+        return left_target, right_target, duration_val, accel_val, accel_interval_val
+
+    def _validate_motion_params(
+        self,
+        duration_val: float,
+        accel: Optional[float],
+        accel_interval: float,
+    ) -> tuple[float, Optional[float], float]:
+        """
+        Clamp the move duration and validate the acceleration parameters.
+
+        Args:
+            duration_val: Move duration in seconds.
+            accel: Optional acceleration in percent per second.
+            accel_interval: Time step for acceleration smoothing in seconds.
+
+        Returns:
+            (duration, accel, accel_interval): Duration clamped to [0.1, move_duration_max],
+            acceleration as a float or None, and the acceleration interval as a float.
+
+        Raises:
+            TracksError: If accel or accel_interval are invalid.
+        """
         # Clamp duration to [0.1, move_duration_max]
         orig_duration = duration_val
         duration_val = max(0.1, min(float(self.move_duration_max), float(duration_val)))
         if duration_val != orig_duration:
             logging.warning(
-                f"Move duration {orig_duration:.2f}s clamped to {duration_val:.2f}s "
-                f"(limits: 0.1s to {self.move_duration_max}s)."
+                "Move duration %.2fs clamped to %.2fs (limits: 0.1s to %ss).",
+                orig_duration, duration_val, self.move_duration_max,
             )
 
+        # Fast path for a plain move with the default interval: the clamped duration is
+        # at least 0.1s, so the interval is always valid and needs no casting
+        if accel is None and type(accel_interval) is float and accel_interval == 0.05:
+            return duration_val, None, accel_interval
+
         # Validate accel and accel_interval
         if accel is not None:
             try:
@@ -723,48 +1118,237 @@ class Tracks:
         if accel_interval_val <= 0 or accel_interval_val > duration_val:
             raise TracksError("Acceleration interval (accel_interval) must be > 0 and <= duration.")
 
-        # Use current speeds as starting point for ramping
+        return duration_val, accel_val, accel_interval_val
+
+    def _plan_ramp(
+        self,
+        left_target: int,
+        right_target: int,
+        duration_val: float,
+        accel_val: Optional[float],
+        accel_interval_val: float,
+        profile: str = "linear",
+    ) -> Optional[tuple[tuple[int, ...], tuple[int, ...]]]:
+        """
+        Decide how to reach the target speeds and plan the acceleration ramp.
+
+        Shared by the sync and async movers, which only differ in how they wait between steps.
+
+        Args:
+            left_target: Sanitized target speed for the left track (-100 to 100).
+            right_target: Sanitized target speed for the right track (-100 to 100).
+            duration_val: Validated duration in seconds.
+            accel_val: Acceleration in percent per second, or None to jump to target speed.
+            accel_interval_val: Validated time step for acceleration smoothing in seconds.
+            profile: Motion profile, one of "linear", "trapezoid" or "scurve".
+
+        Returns:
+            (left_schedule, right_schedule) with one speed per step, or None if the
+            tracks should jump straight to the target speeds.
+        """
         left_start = self.get_left_track_speed()
         right_start = self.get_right_track_speed()
+        decel_to_stop = profile != "linear"
+        if (
+            accel_val is None
+            or accel_val <= 0
+            # Already at target speeds: there is nothing to ramp (nor to ramp down from)
+            or (
+                (left_target, right_target) == (left_start, right_start)
+                and not (decel_to_stop and (left_target or right_target))
+            )
+        ):
+            # No smoothing, jump to target
+            logging.debug(
+                "Jumping to target speeds: left=%s, right=%s, for=%03.2f seconds",
+                left_target, right_target, duration_val,
+            )
+            return None
+        # Smooth acceleration from current speed to target speed
+        logging.debug(
+            "Smoothly accelerating to target speeds: left=%s, right=%s, for=%03.2f seconds "
+            "with accel=%s%% (%s profile)",
+            left_target, right_target, duration_val, accel_val, profile,
+        )
+        # Largest speed change allowed per step; an S-curve peaks at 4/3 of its average slope
+        step_size = accel_val * accel_interval_val
+        if profile == "scurve":
+            step_size /= _SCURVE_PEAK_RATIO
+        # The track with the larger speed change sets the number of steps. For the linear
+        # profile at least one delta is non-zero here, so this is >= 1.
+        largest_delta = max(abs(left_target - left_start), abs(right_target - right_start))
+        steps_needed = math.ceil(largest_delta / step_size)
+        # accel_interval_val <= duration_val, so at least one step always fits
+        total_steps = int(duration_val / accel_interval_val)
+        if not decel_to_stop:
+            steps = min(steps_needed, total_steps)
+            # Precompute the ramp schedule; values are already clamped integers
+            return _ramp_schedule(left_start, left_target, right_start, right_target, steps)
+        up_steps = steps_needed
+        peak = max(abs(left_target), abs(right_target))
+        down_steps = math.ceil(peak / step_size)
+        if up_steps + down_steps <= total_steps:
+            return _profile_samples(
+                left_start, left_target, right_start, right_target,
+                up_steps, down_steps, total_steps, profile,
+            )
+        # Too short to reach the targets and stop at the configured acceleration: lower
+        # the peak speeds, keeping the ratio between the tracks, until both ramps fit.
+        # The last step of the ramp down may fall on the end of the move, where the
+        # tracks are stopped. If even a peak of zero does not fit, the tracks are moving
+        # too fast to stop in time: decelerate at accel for as long as the move lasts.
+        for m in range(peak, -1, -1):
+            left_peak = _scale_speed(left_target, m, max(peak, 1))
+            right_peak = _scale_speed(right_target, m, max(peak, 1))
+            up_steps = math.ceil(
+                max(abs(left_peak - left_start), abs(right_peak - right_start)) / step_size
+            )
+            down_steps = math.ceil(max(abs(left_peak), abs(right_peak)) / step_size)
+            if up_steps + down_steps <= total_steps + 1:
+                break
+        left_schedule, right_schedule = _profile_samples(
+            left_start, left_peak, right_start, right_peak,
+            up_steps, down_steps, max(total_steps, up_steps + down_steps), profile,
+        )
+        return left_schedule[:total_steps], right_schedule[:total_steps]
+
+    def _move_validated(
+        self,
+        left_target: int,
+        right_target: int,
+        duration_val: float,
+        accel_val: Optional[float],
+        accel_interval_val: float,
+        stop_at_end: bool,
+        profile: str = "linear",
+    ) -> None:
+        """
+        Move both tracks with already-validated parameters.
+
+        Args:
+            left_target: Sanitized target speed for the left track (-100 to 100).
+            right_target: Sanitized target speed for the right track (-100 to 100).
+            duration_val: Duration in seconds, already clamped to [0.1, move_duration_max].
+            accel_val: Acceleration in percent per second, or None to jump to target speed.
+            accel_interval_val: Validated time step for acceleration smoothing in seconds.
+            stop_at_end: If True, stop both tracks at the end.
+            profile: Motion profile, one of "linear", "trapezoid" or "scurve".
 
+        Raises:
+            TracksError: If setting the track speeds fails.
+        """
         try:
-            if accel_val is None or accel_val <= 0:
-                # No smoothing, jump to target
-                logging.debug(f"Jumping to target speeds: left={left_target}, right={right_target}, for={duration_val:03.2f} seconds")
+            plan = self._plan_ramp(
+                left_target, right_target, duration_val, accel_val, accel_interval_val, profile
+            )
+            if plan is None:
                 self.set_left_track_speed(left_target)
                 self.set_right_track_speed(right_target)
-                await asyncio.sleep(duration_val)
+                time.sleep(duration_val)
             else:
-                # Smooth acceleration from current speed to target speed
-                logging.debug(f"Smoothly accelerating to target speeds: left={left_target}, right={right_target}, for={duration_val:03.2f} seconds with accel={accel_val}%")
-                import math
-                left_delta = left_target - left_start
-                right_delta = right_target - right_start
-                steps_left = (
-                    math.ceil(abs(left_delta) / (accel_val * accel_interval_val))
-                    if accel_val > 0 and left_delta != 0 else 1
-                )
-                steps_right = (
-                    math.ceil(abs(right_delta) / (accel_val * accel_interval_val))
-                    if accel_val > 0 and right_delta != 0 else 1
-                )
-                steps = max(1, int(max(steps_left, steps_right)))
-                total_steps = max(1, int(duration_val / accel_interval_val))
-                steps = min(steps, total_steps)
-                for i in range(steps):
-                    frac = (i + 1) / steps
-                    left = round(left_start + (left_target - left_start) * frac)
-                    right = round(right_start + (right_target - right_start) * frac)
-                    self.set_left_track_speed(left)
-                    self.set_right_track_speed(right)
-                    await asyncio.sleep(accel_interval_val)
-                # Hold at target for the remainder
-                remaining = duration_val - steps * accel_interval_val
+                left_schedule, right_schedule = plan
+                # Bind the per-step callables once; attribute lookups dominate a tight ramp
+                write = self._write_pwm
+                sleep = time.sleep
+                monotonic = time.monotonic
+                # Sleep until absolute deadlines so wake-up latency does not accumulate
+                t0 = monotonic()
+                for i, (left, right) in enumerate(zip(left_schedule, right_schedule)):
+                    write(left, right)
+                    sleep(max(0.0, t0 + (i + 1) * accel_interval_val - monotonic()))
+                # Hold the last scheduled speeds for the remainder
+                remaining = duration_val - (monotonic() - t0)
                 if remaining > 0:
+                    write(left_schedule[-1], right_schedule[-1])
+                    sleep(remaining)
+            # Profiles that ramp down may leave their final stop to the end of the move
+            if stop_at_end or (plan is not None and profile != "linear"):
+                self.stop()
+        except Exception as e:
+            self.stop()
+            logging.error("Failed to move tracks: %s", e)
+            raise TracksError(f"Failed to move tracks: {e}")
+
+    async def _move_validated_async(
+        self,
+        left_target: int,
+        right_target: int,
+        duration_val: float,
+        accel_val: Optional[float],
+        accel_interval_val: float,
+        stop_at_end: bool,
+        profile: str = "linear",
+    ) -> None:
+        """
+        Asynchronously move both tracks with already-validated parameters.
+
+        Args:
+            left_target: Sanitized target speed for the left track (-100 to 100).
+            right_target: Sanitized target speed for the right track (-100 to 100).
+            duration_val: Duration in seconds, already clamped to [0.1, move_duration_max].
+            accel_val: Acceleration in percent per second, or None to jump to target speed.
+            accel_interval_val: Validated time step for acceleration smoothing in seconds.
+            stop_at_end: If True, stop both tracks at the end.
+            profile: Motion profile, one of "linear", "trapezoid" or "scurve".
+
+        Raises:
+            TracksError: If setting the track speeds fails.
+        """
+        try:
+            # Schedule every ramp step up front on the event loop and wake up once
+            # when the move ends (or request_stop() is called), instead of one
+            # sleep/wake-up per step
+            loop = asyncio.get_running_loop()
+            done: asyncio.Future[None] = loop.create_future()
+            write = self._write_pwm
+
+            def write_step(left: int, right: int) -> None:
+                if done.done() or self._cancel_move:
+                    return
+                try:
+                    write(left, right)
+                except Exception as e:
+                    done.set_exception(e)
+
+            def finish() -> None:
+                if not done.done():
+                    done.set_result(None)
+
+            # Register the move before planning it: from here on a request_stop() from
+            # any thread either sees this finish handle or is seen by the checks below
+            registration = (loop, finish)
+            with self._move_lock:
+                self._cancel_move = False
+                self._move_finish = registration
+            handles: list[asyncio.TimerHandle] = []
+            try:
+                plan = self._plan_ramp(
+                    left_target, right_target, duration_val, accel_val, accel_interval_val,
+                    profile,
+                )
+                t0 = loop.time()
+                if self._cancel_move:
+                    pass  # Stopped before the first step; finish() is already scheduled
+                elif plan is None:
                     self.set_left_track_speed(left_target)
                     self.set_right_track_speed(right_target)
-                    await asyncio.sleep(remaining)
-            if stop_at_end:
+                else:
+                    left_schedule, right_schedule = plan
+                    handles.extend(
+                        loop.call_at(t0 + i * accel_interval_val, write_step, left, right)
+                        for i, (left, right) in enumerate(zip(left_schedule, right_schedule))
+                    )
+                handles.append(loop.call_at(t0 + duration_val, finish))
+                await done
+            finally:
+                # On cancellation, stop request or error, drop the steps that have not run yet
+                with self._move_lock:
+                    if self._move_finish is registration:
+                        self._move_finish = None
+                for handle in handles:
+                    handle.cancel()
+            # Profiles that ramp down may leave their final stop to the end of the move
+            if stop_at_end or self._cancel_move or (plan is not None and profile != "linear"):
                 self.stop()
         except Exception as e:
             self.stop()
@@ -815,7 +1399,8 @@ class Tracks:
         if abs(speed_val) < 5 and abs(speed_val) != 0:
             speed_val = 5 if speed_val > 0 else -5
             logging.warning(
-                f"Turn speed value {orig_speed_val} clamped to {speed_val} for safe turn duration."
+                "Turn speed value %s clamped to %s for safe turn duration.",
+                orig_speed_val, speed_val,
             )
         if radius_cm < 0:
             raise TracksError("Radius must be >= 0.")
@@ -841,17 +1426,21 @@ class Tracks:
         if duration is None:
             raise TracksError("Must specify either duration or angle_deg.")
 
-        # Compute track speeds
+        duration_val, accel_val, accel_interval_val = self._validate_motion_params(
+            self.sanitize_duration(duration), accel, accel_interval
+        )
+
+        # Compute track speeds; arc kinematics may exceed the speed limits, so clamp them
         left_speed, right_speed = self._track_speeds_for_turn(
             speed_val, radius_cm, direction
         )
-        self.move(
-            left_speed,
-            right_speed,
-            duration,
-            accel=accel,
-            accel_interval=accel_interval,
-            stop_at_end=stop_at_end,
+        self._move_validated(
+            self.sanitize_speed(left_speed),
+            self.sanitize_speed(right_speed),
+            duration_val,
+            accel_val,
+            accel_interval_val,
+            stop_at_end,
         )
 
     async def turn_async(
@@ -899,7 +1488,8 @@ class Tracks:
         if abs(speed_val) < 5 and abs(speed_val) != 0:
             speed_val = 5 if speed_val > 0 else -5
             logging.warning(
-                f"Turn speed value {orig_speed_val} clamped to {speed_val} for safe turn duration."
+                "Turn speed value %s clamped to %s for safe turn duration.",
+                orig_speed_val, speed_val,
             )
         # Allow zero speed for decelerating to stop or stopping in place
         if radius_cm < 0:
@@ -926,17 +1516,21 @@ class Tracks:
         if duration is None:
             raise TracksError("Must specify either duration or angle_deg.")
 
-        # Compute track speeds
+        duration_val, accel_val, accel_interval_val = self._validate_motion_params(
+            self.sanitize_duration(duration), accel, accel_interval
+        )
+
+        # Compute track speeds; arc kinematics may exceed the speed limits, so clamp them
         left_speed, right_speed = self._track_speeds_for_turn(
             speed_val, radius_cm, direction
         )
-        await self.move_async(
-            left_speed,
-            right_speed,
-            duration,
-            accel=accel,
-            accel_interval=accel_interval,
-            stop_at_end=stop_at_end,
+        await self._move_validated_async(
+            self.sanitize_speed(left_speed),
+            self.sanitize_speed(right_speed),
+            duration_val,
+            accel_val,
+            accel_interval_val,
+            stop_at_end,
         )
 
     def stop(self) -> None:
@@ -949,6 +1543,24 @@ class Tracks:
         self.set_left_track_speed(0)
         self.set_right_track_speed(0)
 
+    def request_stop(self) -> None:
+        """
+        Ask a running asynchronous move or turn to end early and stop the tracks.
+
+        Unlike cancelling the task, the interrupted move_async()/turn_async() call
+        returns normally with both tracks stopped. Safe to call from other threads,
+        e.g. from an obstacle sensor callback. Has no effect if no async move is running.
+
+        Example:
+            tracks.request_stop()
+        """
+        with self._move_lock:
+            self._cancel_move = True
+            pending = self._move_finish
+        if pending is not None:
+            loop, finish = pending
+            loop.call_soon_threadsafe(finish)
+
     def _track_speeds_for_turn(
         self, speed: int, radius_cm: float, direction: str
     ) -> tuple[int, int]:
@@ -970,22 +1582,7 @@ class Tracks:
             tracks._track_speeds_for_turn(70, 0, "left")   # (-70, 70)
             tracks._track_speeds_for_turn(70, 20, "right") # (84, 56)
         """
-        w = self.track_width_cm
-        if radius_cm == 0:
-            # Spin in place: one track forward, one reverse
-            if direction == "left":
-                return -speed, speed
-            else:
-                return speed, -speed
-        # Arc turn: use differential drive kinematics
-        v = speed
-        r = radius_cm
-        v_l = v * (r - w / 2) / r
-        v_r = v * (r + w / 2) / r
-        if direction == "left":
-            return int(round(v_l)), int(round(v_r))
-        else:
-            return int(round(v_r)), int(round(v_l))
+        return _track_speeds_for_turn(speed, radius_cm, self.track_width_cm, direction == "left")
 
     def _turn_duration_for_angle(
         self, speed: int, radius_cm: float, angle_deg: float
@@ -1018,26 +1615,23 @@ class Tracks:
         speed = max(5, min(100, abs(speed)))
         if speed != abs(orig_speed):
             logging.warning(
-                f"Speed value {orig_speed} clamped to {speed} for turn duration calculation."
+                "Speed value %s clamped to %s for turn duration calculation.", orig_speed, speed
             )
 
         # Calibration: at speed 70, 3.5s -> 30cm straight
-        base_cm_per_sec = self.base_distance / self.base_duration
-        cm_per_sec = speed * (base_cm_per_sec / self.base_speed)
-        if radius_cm == 0:
-            arc_len = self.track_width_cm * math.pi * (angle_deg / 360)
-            duration = arc_len / cm_per_sec
-        else:
-            arc_len = 2 * math.pi * radius_cm * (angle_deg / 360)
-            duration = arc_len / cm_per_sec
+        cm_per_sec = speed * self.base_distance / (self.base_duration * self.base_speed)
+        # Round cache key inputs to raise the hit rate (0.01 cm/deg is below track precision)
+        duration = _turn_duration(
+            cm_per_sec, round(radius_cm, 2), round(angle_deg, 2), self.track_width_cm
+        )
 
         # Clamp duration to [0.1, move_duration_max] with warning
         orig_duration = duration
         duration = max(0.1, min(float(self.move_duration_max), float(duration)))
         if duration != orig_duration:
             logging.warning(
-                f"Turn duration {orig_duration:.2f}s clamped to {duration:.2f}s "
-                f"(limits: 0.1s to {self.move_duration_max}s)."
+                "Turn duration %.2fs clamped to %.2fs (limits: 0.1s to %ss).",
+                orig_duration, duration, self.move_duration_max,
             )
         return float(duration)
 
@@ -1077,14 +1671,16 @@ class Tracks:
             start_speed = max(5, min(100, abs(start_speed)))
             if start_speed != abs(orig_start_speed):
                 logging.warning(
-                    f"Start speed value {orig_start_speed} clamped to {start_speed} for turn duration with accel."
+                    "Start speed value %s clamped to %s for turn duration with accel.",
+                    orig_start_speed, start_speed,
                 )
         else:
             start_speed = 0
         target_speed = max(5, min(100, abs(target_speed)))
         if target_speed != abs(orig_target_speed):
             logging.warning(
-                f"Target speed value {orig_target_speed} clamped to {target_speed} for turn duration with accel."
+                "Target speed value %s clamped to %s for turn duration with accel.",
+                orig_target_speed, target_speed,
             )
 
         # Calibration: at speed 70, 3.5s -> 30cm straight
@@ -1092,10 +1688,7 @@ class Tracks:
         v0 = start_speed * (base_cm_per_sec / self.base_speed)
         v1 = target_speed * (base_cm_per_sec / self.base_speed)
 
-        if radius_cm == 0:
-            arc_len = self.track_width_cm * math.pi * (angle_deg / 360)
-        else:
-            arc_len = 2 * math.pi * radius_cm * (angle_deg / 360)
+        arc_len = _arc_length(radius_cm, angle_deg, self.track_width_cm)
 
         # Convert accel from percent/sec to cm/s^2
         accel_cms2 = abs(accel) * (base_cm_per_sec / self.base_speed)
@@ -1131,8 +1724,8 @@ class Tracks:
         duration = max(0.1, min(float(self.move_duration_max), float(duration)))
         if duration != orig_duration:
             logging.warning(
-                f"Turn duration {orig_duration:.2f}s clamped to {duration:.2f}s "
-                f"(limits: 0.1s to {self.move_duration_max}s)."
+                "Turn duration %.2fs clamped to %.2fs (limits: 0.1s to %ss).",
+                orig_duration, duration, self.move_duration_max,
             )
         return float(duration)
 
@@ -1167,9 +1760,14 @@ class Tracks:
         Returns:
             float: Current arc speed as a percentage (0-100).
         """
-        base_cm_per_sec = self.base_distance / self.base_duration
-        arc_speed_cm_s = self._current_arc_speed_cm_s(radius_cm)
-        # Convert cm/s back to percent of base speed
-        arc_speed_percent = (arc_speed_cm_s / base_cm_per_sec) * self.base_speed
+        # The calibration factor cancels out when converting cm/s back to percent,
+        # so average the commanded track speeds directly.
+        v_l = self.get_left_track_speed()
+        v_r = self.get_right_track_speed()
+        if radius_cm == 0:
+            # For spin in place, use the average of the absolute values
+            arc_speed_percent = (abs(v_l) + abs(v_r)) / 2.0
+        else:
+            arc_speed_percent = (v_l + v_r) / 2.0
         # Clamp to [0, 100]
         return max(0.0, min(100.0, abs(arc_speed_percent)))
@@ -5,14 +5,18 @@ Provides a modular, testable interface for reading values from an ultrasonic dis
 
 Features:
 - Supports both synchronous and asynchronous distance measurement.
+- Rejects outliers with `measure_distance_median()`, the median of several pings.
 - Allows registering observers for distance updates.
 - Thread-safe operations for multi-threaded applications.
 - Custom exception handling for GPIO errors.
 - Dependency injection for GPIO interface, allowing testing with mock objects.
 - Detects if running on a Raspberry Pi and uses RPi.GPIO if available.
+- Waits for the echo pulse with GPIO edge events (`wait_for_edge`) when the backend supports
+  them, instead of busy-polling the echo pin for the whole pulse.
 - Provides temperature compensation for distance measurements using the
   `UltraSonic.adjust_measurement_based_on_temp()` class method, which adjusts the measured
   distance based on the actual ambient temperature for improved accuracy.
+  `UltraSonic.adjust_measurement_based_on_temp_batch()` applies the same adjustment to a batch.
 
 Requires:
 - Python 3.10+
@@ -34,15 +38,18 @@ Usage example:
     # For async usage, see measure_distance_async() and async_monitor() method docstrings.
 """
 
-from typing import Callable, List, Optional, Protocol, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, ClassVar, Iterable, Optional, Protocol, Any
 import threading
 import logging
-import platform
+import os
+import statistics
+import sys
 import time
 import asyncio
 
 # Only import RPi.GPIO if running on a Raspberry Pi
-if platform.system() == "Linux" and ("arm" in platform.machine() or "aarch64" in platform.machine()):
+if sys.platform == "linux" and os.uname().machine.startswith(("arm", "aarch64")):
     try:
         import RPi.GPIO as GPIO
     except ImportError:
@@ -50,6 +57,15 @@ if platform.system() == "Linux" and ("arm" in platform.machine() or "aarch64" in
 else:
     GPIO = None  # type: ignore
 
+# Speed of sound at 20°C (343 m/s) in cm/s, halved for the echo round trip
+_CM_PER_SEC_HALF = 34300 / 2
+# Echo pulse width in nanoseconds to distance in tenths of a centimeter
+_TENTHS_CM_PER_NS = _CM_PER_SEC_HALF * 10 / 1e9
+_TRIGGER_SETTLE_NS = 2_000_000  # Trigger LOW time required before a pulse
+_TRIGGER_PULSE_NS = 10_000  # Trigger pulse width
+_ECHO_SPIN_NS = 2_000_000  # Echo polling time before blocking on edge events
+_ECHO_RISE_WAIT_MS = 1  # Longest single wait for the echo to rise
+
 class UltraSonicError(Exception):
     """Custom exception for ultrasonic sensor errors."""
     pass
@@ -60,12 +76,21 @@ class UltraSonicEvent:
     Attributes:
         distance_cm (float): The measured distance in centimeters.
     """
+    __slots__ = ("distance_cm",)
+
     def __init__(self, distance_cm: float) -> None:
         self.distance_cm = distance_cm
 
 UltraSonicObserver = Callable[[UltraSonicEvent], None]
 
 class GPIOInterface(Protocol):
+    """
+    Protocol for the GPIO backend (RPi.GPIO or a mock).
+
+    Backends may also provide RISING/FALLING constants and
+    wait_for_edge(pin, edge, timeout=ms), which returns None on timeout. If present,
+    it is used to wait for the echo pulse without busy-polling input().
+    """
     BCM: Any
     IN: Any
     OUT: Any
@@ -91,8 +116,13 @@ class UltraSonic:
         UltraSonicError: If GPIO is not available or setup fails.
 
     Thread Safety:
-        All public methods are thread-safe.
+        All public methods are thread-safe, except that start_monitoring() should be
+        called from a single owner thread; stop_monitoring() may be called from any thread.
     """
+    # Small worker pool shared by all sensors for measure_distance_async()
+    _executor: ClassVar[Optional[ThreadPoolExecutor]] = None
+    _executor_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         trigger_pin: int,
@@ -103,13 +133,26 @@ class UltraSonic:
         self.trigger_pin = trigger_pin
         self.echo_pin = echo_pin
         self._gpio = gpio or GPIO
+        # No injected backend: the RPi.GPIO module itself
+        self._uses_rpi_gpio = gpio is None
         self._timeout = timeout
-        self._observers: List[UltraSonicObserver] = []
+        # Copy-on-write: replaced (never mutated) under the lock, read without it
+        self._observers: tuple[UltraSonicObserver, ...] = ()
         self._lock = threading.Lock()
         self._monitor_thread: Optional[threading.Thread] = None
-        self._monitoring = threading.Event()
+        self._monitor_task: Optional[asyncio.Task[None]] = None
+        # Set while monitoring is stopped; the monitor thread sleeps on it so a stop wakes it at once
+        self._stop_monitor = threading.Event()
+        self._stop_monitor.set()
+        # perf_counter_ns() time since when the trigger pin is known to be LOW, or None
+        self._trigger_low_since: Optional[int] = None
+        self._cleaned = False
         if self._gpio is None:
             raise UltraSonicError("RPi.GPIO library not available.")
+        # Cached once: the trigger is driven several times per ping
+        self._output = self._gpio.output
+        self._low = self._gpio.LOW
+        self._high = self._gpio.HIGH
         self._setup_gpio()
 
     def _setup_gpio(self) -> None:
@@ -117,7 +160,8 @@ class UltraSonic:
             self._gpio.setmode(self._gpio.BCM)
             self._gpio.setup(self.trigger_pin, self._gpio.OUT)
             self._gpio.setup(self.echo_pin, self._gpio.IN)
-            self._gpio.output(self.trigger_pin, self._gpio.LOW)
+            self._output(self.trigger_pin, self._low)
+            self._trigger_low_since = time.perf_counter_ns()
         except Exception as exc:
             raise UltraSonicError(f"Failed to setup GPIO pins: {exc}")
 
@@ -135,7 +179,7 @@ class UltraSonic:
             ultra.add_observer(on_distance)
         """
         with self._lock:
-            self._observers.append(observer)
+            self._observers = self._observers + (observer,)
 
     def remove_observer(self, observer: UltraSonicObserver) -> None:
         """
@@ -145,19 +189,25 @@ class UltraSonic:
             observer: The observer to remove.
         """
         with self._lock:
+            observers = list(self._observers)
             try:
-                self._observers.remove(observer)
+                observers.remove(observer)
             except ValueError:
-                pass
+                return
+            self._observers = tuple(observers)
 
     def _notify_observers(self, distance_cm: float) -> None:
+        observers = self._observers
+        if not observers:
+            return
         event = UltraSonicEvent(distance_cm)
-        with self._lock:
-            for observer in list(self._observers):
-                try:
-                    observer(event)
-                except Exception:
-                    pass  # Optionally log
+        # Callbacks run without the lock, so a slow observer cannot block (or deadlock
+        # by calling) add_observer()/remove_observer()
+        for observer in observers:
+            try:
+                observer(event)
+            except Exception:
+                pass  # Optionally log
 
     def measure_distance(self) -> float:
         """
@@ -173,32 +223,183 @@ class UltraSonic:
             dist = ultra.measure_distance()
             print(f"Measured: {dist:.2f} cm")
         """
+        distance_cm = self._ping()
+        self._notify_observers(distance_cm)
+        return distance_cm
+
+    def measure_distance_median(self, samples: int = 5, interval: float = 0.06) -> float:
+        """
+        Measure distance as the median of several pings, rejecting outliers (blocking).
+
+        Missed echoes and stray reflections produce occasional wild readings; the median
+        ignores them. Pings that time out are skipped. Observers are notified once, with
+        the median.
+
+        Pings are spaced `interval` seconds apart: an HC-SR04 needs about 60 ms between
+        triggers, or late echoes of the previous ping land in the next one. For an even
+        number of readings the lower median is returned, so the result is always one of
+        the (0.1 cm floored) readings rather than an average of two.
+
+        Args:
+            samples (int): Number of pings to take (default 5).
+            interval (float): Seconds to wait between pings (default 0.06).
+
+        Returns:
+            float: Median distance in centimeters.
+        Raises:
+            ValueError: If samples is less than 1 or interval is negative.
+            UltraSonicError: If every ping fails.
+
+        Example:
+            ultra = UltraSonic(trigger_pin=23, echo_pin=24)
+            dist = ultra.measure_distance_median(samples=7)
+        """
+        if samples < 1:
+            raise ValueError("samples must be at least 1")
+        if interval < 0:
+            raise ValueError("interval must be non-negative")
+        readings = []
+        error: Optional[UltraSonicError] = None
+        for i in range(samples):
+            if i:
+                time.sleep(interval)
+            try:
+                readings.append(self._ping())
+            except UltraSonicError as exc:
+                error = exc
+        if not readings:
+            raise UltraSonicError(f"All {samples} measurements failed: {error}")
+        distance_cm = statistics.median_low(readings)
+        self._notify_observers(distance_cm)
+        return distance_cm
+
+    def _ping(self) -> float:
+        """Trigger one ping and return the echo distance in cm, without notifying observers."""
         try:
-            self._gpio.output(self.trigger_pin, self._gpio.LOW)
-            time.sleep(0.002)
-            self._gpio.output(self.trigger_pin, self._gpio.HIGH)
-            time.sleep(0.00001)
-            self._gpio.output(self.trigger_pin, self._gpio.LOW)
-            start = time.time()
-            timeout = start + self._timeout
-            # Wait for echo to go HIGH
-            while self._gpio.input(self.echo_pin) == 0:
-                if time.time() > timeout:
-                    raise UltraSonicError("Timeout waiting for echo HIGH")
-            pulse_start = time.time()
-            # Wait for echo to go LOW
-            while self._gpio.input(self.echo_pin) == 1:
-                if time.time() > timeout:
-                    raise UltraSonicError("Timeout waiting for echo LOW")
-            pulse_end = time.time()
-            pulse_duration = pulse_end - pulse_start
-            distance_cm = (pulse_duration * 34300) / 2 # Speed of sound at 20°C is 343m/s
+            # The trigger must be LOW for 2 ms before the pulse; skip the settle delay if
+            # it has already been LOW that long (e.g. since the previous measurement)
+            output = self._output
+            trigger_pin = self.trigger_pin
+            low_since = self._trigger_low_since
+            if low_since is None or time.perf_counter_ns() - low_since < _TRIGGER_SETTLE_NS:
+                output(trigger_pin, self._low)
+                time.sleep(0.002)
+            self._trigger_low_since = None
+            output(trigger_pin, self._high)
+            # Spin for the 10 us pulse: time.sleep() would oversleep by 0.1-2 ms
+            pulse_end_ns = time.perf_counter_ns() + _TRIGGER_PULSE_NS
+            while time.perf_counter_ns() < pulse_end_ns:
+                pass
+            output(trigger_pin, self._low)
+            self._trigger_low_since = time.perf_counter_ns()
+            # Monotonic integer nanoseconds: immune to wall-clock steps and float rounding
+            start = time.perf_counter_ns()
+            timeout = start + int(self._timeout * 1e9)
+            wait_for_edge = getattr(self._gpio, "wait_for_edge", None)
+            if wait_for_edge is not None:
+                pulse_start, pulse_end = self._wait_for_echo_edges(wait_for_edge, timeout)
+            else:
+                # Bind the per-iteration lookups once: the loop period limits pulse resolution
+                read = self._gpio.input
+                echo_pin = self.echo_pin
+                now = time.perf_counter_ns
+                # Wait for echo to go HIGH
+                while read(echo_pin) == 0:
+                    if now() > timeout:
+                        raise UltraSonicError("Timeout waiting for echo HIGH")
+                pulse_start = now()
+                # Wait for echo to go LOW
+                while read(echo_pin) == 1:
+                    if now() > timeout:
+                        raise UltraSonicError("Timeout waiting for echo LOW")
+                pulse_end = now()
             # Floor to one decimal place (e.g., 99.98 -> 99.9, not 100.0)
-            distance_cm = int(distance_cm * 10) / 10
-            self._notify_observers(distance_cm)
-            return distance_cm
+            return int((pulse_end - pulse_start) * _TENTHS_CM_PER_NS) / 10
+        except UltraSonicError:
+            raise
         except Exception as exc:
-            raise UltraSonicError(f"Failed to measure distance: {exc}")
+            raise UltraSonicError(f"Failed to measure distance: {exc}") from exc
+
+    def _wait_for_echo_edges(
+        self, wait_for_edge: Callable[..., Any], timeout: int
+    ) -> tuple[int, int]:
+        """
+        Time the echo pulse with GPIO edge events instead of polling for its whole length.
+
+        Used when the GPIO backend provides wait_for_edge() (e.g., RPi.GPIO), so long
+        waits happen in the kernel without spinning the CPU.
+
+        Args:
+            wait_for_edge: The backend's wait_for_edge(pin, edge, timeout=ms) function.
+            timeout: Absolute time.perf_counter_ns() deadline for the whole pulse.
+
+        Returns:
+            tuple[int, int]: Start and end time of the echo pulse in perf_counter_ns() units.
+        Raises:
+            UltraSonicError: On timeout.
+        """
+        gpio: Any = self._gpio  # RISING/FALLING are optional members of GPIOInterface
+        # Wait for the rise in short slices: if it is missed, the echo must still be HIGH
+        # when the level is re-checked
+        pulse_start = self._wait_for_echo_level(
+            wait_for_edge, gpio.RISING, 1, timeout, _ECHO_RISE_WAIT_MS
+        )
+        if pulse_start is None:
+            raise UltraSonicError("Timeout waiting for echo HIGH")
+        pulse_end = self._wait_for_echo_level(wait_for_edge, gpio.FALLING, 0, timeout)
+        if pulse_end is None:
+            raise UltraSonicError("Timeout waiting for echo LOW")
+        return pulse_start, pulse_end
+
+    def _wait_for_echo_level(
+        self,
+        wait_for_edge: Callable[..., Any],
+        edge: Any,
+        level: int,
+        timeout: int,
+        wait_ms: Optional[int] = None,
+    ) -> Optional[int]:
+        """
+        Wait for the echo pin to reach a level, polling briefly before blocking on edges.
+
+        Arming an edge wait takes up to about a millisecond, during which an edge goes
+        unreported. The pin is therefore polled for the first _ECHO_SPIN_NS, which covers
+        the echo's usual rise and the whole pulse of close targets. After that, the level
+        is re-checked whenever a wait times out: a change found there went unreported,
+        most likely because it happened while the wait was being armed, so it is timed
+        from the moment that wait was armed.
+
+        Args:
+            wait_for_edge: The backend's wait_for_edge(pin, edge, timeout=ms) function.
+            edge: The backend's RISING or FALLING constant.
+            level: The level to wait for (1 for HIGH, 0 for LOW).
+            timeout: Absolute time.perf_counter_ns() deadline.
+            wait_ms: Longest single edge wait in milliseconds, or None to wait until
+                the deadline.
+
+        Returns:
+            Optional[int]: perf_counter_ns() time the level was reached, or None on timeout.
+        """
+        read = self._gpio.input
+        echo_pin = self.echo_pin
+        now = time.perf_counter_ns
+        spin_until = min(now() + _ECHO_SPIN_NS, timeout)
+        while now() < spin_until:
+            if read(echo_pin) == level:
+                return now()
+        armed_at: Optional[int] = None
+        while True:
+            checked_at = now()
+            if read(echo_pin) == level:
+                return armed_at if armed_at is not None else checked_at
+            if checked_at > timeout:
+                return None
+            armed_at = checked_at
+            remaining_ms = max(1, (timeout - checked_at) // 1_000_000)
+            if wait_ms is not None:
+                remaining_ms = min(remaining_ms, wait_ms)
+            if wait_for_edge(echo_pin, edge, timeout=remaining_ms) is not None:
+                return now()
 
     async def measure_distance_async(self) -> float:
         """
@@ -216,13 +417,54 @@ class UltraSonic:
             print(f"Measured: {dist:.2f} cm")
         """
         loop = asyncio.get_running_loop()
-        return await loop.run_in_executor(None, self.measure_distance)
+        return await loop.run_in_executor(self._get_executor(), self.measure_distance)
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        """
+        Return the shared measurement executor, creating it on first use.
+
+        The pool is bounded so that many sensors (or many event loops) cannot pile up
+        worker threads on a small board.
+        """
+        executor = cls._executor
+        if executor is None:
+            with cls._executor_lock:
+                executor = cls._executor
+                if executor is None:
+                    executor = ThreadPoolExecutor(
+                        max_workers=min(4, os.cpu_count() or 1),
+                        thread_name_prefix="ultrasonic",
+                    )
+                    UltraSonic._executor = executor
+        return executor
+
+    @classmethod
+    def shutdown_executor(cls, wait: bool = True) -> None:
+        """
+        Shut down the worker pool shared by measure_distance_async().
+
+        A new pool is created automatically on the next asynchronous measurement.
+
+        Args:
+            wait: Whether to wait for pending measurements to finish.
+
+        Example:
+            UltraSonic.shutdown_executor()
+        """
+        with cls._executor_lock:
+            executor, UltraSonic._executor = UltraSonic._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
 
     def start_monitoring(self, interval: float = 0.5) -> None:
         """
         Start background monitoring, measuring distance at regular intervals (seconds).
         Observers are notified on each measurement.
 
+        When called from within a running asyncio event loop, monitoring runs as a task
+        on that loop (see async_monitor()); otherwise a background thread is started.
+
         Args:
             interval: Time in seconds between measurements (default 0.5).
 
@@ -233,61 +475,116 @@ class UltraSonic:
         """
         if self._monitor_thread and self._monitor_thread.is_alive():
             return
-        self._monitoring.set()
+        if self._monitor_task is not None and not self._monitor_task.done():
+            return
+        self._stop_monitor.clear()
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None:
+            # Share the caller's loop instead of dedicating a thread that mostly sleeps
+            self._monitor_task = loop.create_task(self.async_monitor(interval))
+            return
         self._monitor_thread = threading.Thread(target=self._monitor_loop, args=(interval,), daemon=True)
         self._monitor_thread.start()
 
     def stop_monitoring(self) -> None:
         """
-        Stop background monitoring.
+        Stop background monitoring. Safe to call from any thread.
 
         Example:
             ultra.stop_monitoring()
         """
-        self._monitoring.clear()
+        self._stop_monitor.set()
+        task, self._monitor_task = self._monitor_task, None
+        if task is not None and not task.done():
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is task.get_loop():
+                task.cancel()
+            else:
+                task.get_loop().call_soon_threadsafe(task.cancel)
         if self._monitor_thread:
             self._monitor_thread.join(timeout=1)
 
     def _monitor_loop(self, interval: float) -> None:
-        while self._monitoring.is_set():
+        stop = self._stop_monitor
+        while not stop.is_set():
             try:
-                dist = self.measure_distance()
                 # Observers are notified in measure_distance()
+                self.measure_distance()
             except UltraSonicError:
                 pass
-            time.sleep(interval)
+            stop.wait(interval)
 
-    async def async_monitor(self, interval: float = 0.5) -> None:
+    async def async_monitor(
+        self, interval: float = 0.5, stop_event: Optional[asyncio.Event] = None
+    ) -> None:
         """
         Asynchronously monitor the sensor, measuring distance at regular intervals (seconds).
         Observers are notified on each measurement.
 
+        Measurements are scheduled on a fixed cadence from the loop clock, so the time a
+        measurement takes does not accumulate as drift. If a measurement overruns the
+        interval, the schedule restarts from now instead of firing a burst to catch up.
+
         Args:
             interval: Time in seconds between measurements (default 0.5).
+            stop_event: Optional event that ends monitoring when set (the task can also
+                be cancelled).
 
         Example:
             import asyncio
             ultra = UltraSonic(trigger_pin=23, echo_pin=24)
             ultra.add_observer(lambda e: print(e.distance_cm))
-            await ultra.async_monitor(interval=1.0)
+            stop = asyncio.Event()
+            await ultra.async_monitor(interval=1.0, stop_event=stop)
         """
-        while True:
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while stop_event is None or not stop_event.is_set():
             try:
-                dist = await self.measure_distance_async()
+                await self.measure_distance_async()
                 # Observers are notified in measure_distance()
             except UltraSonicError:
                 pass
-            await asyncio.sleep(interval)
+            next_tick += interval
+            delay = next_tick - loop.time()
+            if delay < 0:
+                next_tick -= delay
+                delay = 0.0
+            if stop_event is None:
+                await asyncio.sleep(delay)
+                continue
+            try:
+                await asyncio.wait_for(stop_event.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
 
     def cleanup(self) -> None:
         """
         Clean up GPIO resources for the trigger and echo pins.
 
+        Safe to call more than once; only the first call releases the pins.
+
         Example:
             ultra.cleanup()
         """
-        self._gpio.cleanup(self.trigger_pin)
-        self._gpio.cleanup(self.echo_pin)
+        with self._lock:
+            if self._cleaned:
+                return
+            self._cleaned = True
+        pins = (self.trigger_pin, self.echo_pin)
+        if self._uses_rpi_gpio:
+            # RPi.GPIO releases a list/tuple of channels in one call
+            GPIO.cleanup(pins)
+        else:
+            # Injected backends only promise cleanup(pin)
+            for pin in pins:
+                self._gpio.cleanup(pin)
 
     @classmethod
     def adjust_measurement_based_on_temp(
@@ -318,4 +615,35 @@ class UltraSonic:
         adjusted_distance = measured_distance_cm * (speed_of_sound_actual / 343.0)
         # Floor to one decimal place
         adjusted_distance = int(adjusted_distance * 10) / 10
-        return adjusted_distance
\ No newline at end of file
+        return adjusted_distance
+
+    @classmethod
+    def adjust_measurement_based_on_temp_batch(
+        cls,
+        temperatures_c: Iterable[float],
+        measured_distances_cm: Iterable[float]
+    ) -> list[float]:
+        """
+        Adjust a batch of distance measurements (in cm) for the speed of sound at each temperature.
+
+        Equivalent to calling adjust_measurement_based_on_temp() for every pair. Useful for
+        calibration or replaying logged measurements.
+
+        Args:
+            temperatures_c (Iterable[float]): Temperatures in degrees Celsius, one per measurement.
+            measured_distances_cm (Iterable[float]): Measured distances in cm, assuming
+                speed of sound at 20°C (343 m/s).
+
+        Returns:
+            list[float]: The adjusted distances in cm (floored to 1 decimal point).
+
+        Raises:
+            ValueError: If the two inputs have different lengths.
+
+        Example:
+            adjusted = UltraSonic.adjust_measurement_based_on_temp_batch([25.0, 24.5], [100.0, 98.2])
+        """
+        return [
+            cls.adjust_measurement_based_on_temp(temp, dist)
+            for temp, dist in zip(temperatures_c, measured_distances_cm, strict=True)
+        ]
\ No newline at end of file
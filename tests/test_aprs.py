@@ -1,16 +1,21 @@
 import sys
 import os
+import asyncio
+import functools
 import unittest
-from typing import Any, List
+from types import MappingProxyType
+from collections import deque
+from typing import Any, Callable, Deque
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
 
-from aprsrover.aprs import Aprs, AprsError, KISSInterface
-from ax253 import Frame
+from aprsrover.aprs import Aprs, AprsError, KISSInterface, _ui_frame
+from ax253 import Address, Frame
 
 class DummyKissProtocol:
     def __init__(self):
-        self.written_frames: List[Frame] = []
-        self.read_frames: List[Frame] = []
+        # Bounded: tests only inspect the most recent frames
+        self.written_frames: Deque[Frame] = deque(maxlen=16)
+        self.read_frames: Deque[Frame] = deque(maxlen=16)
         self.read_called = False
 
     def write(self, frame: Frame) -> None:
@@ -36,13 +41,131 @@ class DummyKISS(KISSInterface):
     def read(self):
         return self.protocol.read()
 
+def initialized(flag: bool) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Run a TestAprs test with the shared Aprs's `initialized` flag set to `flag`."""
+    def decorator(test: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(test)
+        def wrapper(self: "TestAprs") -> Any:
+            self.aprs.initialized = flag
+            return test(self)
+        return wrapper
+    return decorator
+
+def _noop(frame: Frame) -> None:
+    pass
+
+def _other_noop(frame: Frame) -> None:
+    """A second no-op observer, distinct from _noop."""
+    pass
+
+# Info fields of incoming frames. Message addressees are padded to 9 chars,
+# as in the APRS message format.
+INFO_DEST_1 = b":DEST-1   :hello"
+INFO_DEST_2_UNPADDED = b":DEST-2:hello"
+INFO_CALL_5_MSG = b":CALL-5   :test message{123"
+INFO_OTHER = b":OTHER:hello"
+INFO_CALL_7_ACK_REQ = b":CALL-7     :test{42"
+INFO_CALL_8_ACK_REQ = b":CALL-8     :test{42"
+INFO_DEST_24 = b":DEST-24  :hello"
+
+# Exact info fields expected from the send tests below
+EXPECTED_MESSAGE_INFO = b":DEST-10  :Hello APRS"
+EXPECTED_ACK_INFO = b":SRC      :ack42"
+EXPECTED_OBJECT_INFO = b";CALL-15  *011234z5132.07N/00007.40W>Test object"
+EXPECTED_NAMED_OBJECT_INFO = b";OBJNAME  *011234z5132.07N/00007.40W>Test object"
+EXPECTED_TIMED_POSITION_INFO = b"/011234z5132.07N/00007.40W>Test position"
+EXPECTED_POSITION_INFO = b"!5132.07N/00007.40W>No time"
+EXPECTED_TIMED_STATUS_INFO = b">092345zNet Control Center"
+EXPECTED_STATUS_INFO = b">Mission started"
+
+ADDR_X = Address(b"X")
+ADDR_Y = Address(b"Y")
+ADDR_SRC = Address(b"SRC")
+
+# Incoming frames shared by the observer/notify tests (never mutated)
+FRAME_DEST_1 = Frame(destination=ADDR_X, source=ADDR_Y, path=[], info=INFO_DEST_1)
+FRAME_DEST_2_UNPADDED = Frame(destination=ADDR_X, source=ADDR_Y, path=[], info=INFO_DEST_2_UNPADDED)
+FRAME_CALL_5_MSG = Frame(destination=ADDR_X, source=ADDR_Y, path=[], info=INFO_CALL_5_MSG)
+FRAME_OTHER = Frame(destination=ADDR_X, source=ADDR_Y, path=[], info=INFO_OTHER)
+FRAME_CALL_7_ACK_REQ = Frame(destination=ADDR_X, source=ADDR_SRC, path=[], info=INFO_CALL_7_ACK_REQ)
+FRAME_CALL_8_ACK_REQ = Frame(destination=ADDR_X, source=ADDR_SRC, path=[], info=INFO_CALL_8_ACK_REQ)
+FRAME_DEST_24 = Frame(destination=ADDR_X, source=ADDR_Y, path=[], info=INFO_DEST_24)
+
+# Oversized fields, one character past each APRS length limit
+TOO_LONG_MESSAGE = "X" * 68
+TOO_LONG_COMMENT = "X" * 44
+TOO_LONG_STATUS = "X" * 63
+TOO_LONG_TIMED_STATUS = "X" * 56
+
+# Callsigns and paths every send API must reject
+BAD_CALLSIGNS = (
+    "",
+    "BADCALL",
+    "call-10",
+    "CALL-10\n",
+    "CALL-\u0661",
+    "AB-1",
+    "TOOLONG-1",
+    "CALL-123",
+    "CALL-",
+    "-1",
+    "CA LL-1",
+    None,
+)
+BAD_PATHS = ("notalist", None, [""], ["WIDE1-1", ""], ["WIDE1-1", None], [["WIDE1-1"]])
+
+# Valid keyword arguments for each send API; tests override single fields
+MESSAGE_BASE = MappingProxyType({
+    "mycall": "CALL-10",
+    "path": ["WIDE1-1"],
+    "recipient": "DEST-10",
+    "message": "Hello",
+})
+OBJECT_BASE = MappingProxyType({
+    "mycall": "CALL-15",
+    "path": ["WIDE1-1"],
+    "time_dhm": "011234z",
+    "lat_dmm": "5132.07N",
+    "long_dmm": "00007.40W",
+    "symbol_id": "/",
+    "symbol_code": ">",
+    "comment": "Test object",
+})
+POSITION_BASE = MappingProxyType({
+    "mycall": "CALL-32",
+    "path": ["WIDE1-1"],
+    "lat": "5132.07N",
+    "lon": "00007.40W",
+    "symbol_id": "/",
+    "symbol_code": ">",
+    "comment": "Test",
+})
+STATUS_BASE = MappingProxyType({
+    "mycall": "CALL-42",
+    "path": ["WIDE1-1"],
+    "status": "Test",
+})
+
 class TestAprs(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Built once; setUp resets the state individual tests mutate
+        cls.dummy_kiss = DummyKISS()
+        cls.aprs = Aprs(host="localhost", port=8001, kiss=cls.dummy_kiss)
+        cls.transport = object()
+
     def setUp(self) -> None:
-        self.dummy_kiss = DummyKISS()
-        self.aprs = Aprs(host="localhost", port=8001, kiss=self.dummy_kiss)
-        self.aprs.kiss_protocol = self.dummy_kiss.protocol
-        self.aprs.transport = object()
+        protocol = self.dummy_kiss.protocol
+        protocol.written_frames.clear()
+        protocol.read_frames.clear()
+        protocol.read_called = False
+        self.aprs._observers.clear()
+        self.aprs.kiss_protocol = protocol
+        self.aprs.transport = self.transport
+        self.aprs.APRS_SW_VERSION = "APDW16"
         self.aprs.initialized = True
+        # Frames sent through the dummy protocol during this test
+        self.written = protocol.written_frames
 
     def test_register_and_unregister_observer(self):
         calls = []
@@ -54,22 +177,18 @@ class TestAprs(unittest.TestCase):
         self.assertNotIn("CALL-1", self.aprs._observers)
 
     def test_unregister_observer_all(self):
-        cb1 = lambda f: None
-        cb2 = lambda f: None
-        self.aprs.register_observer("CALL-2", cb1)
-        self.aprs.register_observer("CALL-2", cb2)
+        self.aprs.register_observer("CALL-2", _noop)
+        self.aprs.register_observer("CALL-2", _other_noop)
         self.aprs.unregister_observer("CALL-2")
         self.assertNotIn("CALL-2", self.aprs._observers)
 
     def test_unregister_observer_not_found(self):
-        cb = lambda f: None
-        self.aprs.register_observer("CALL-3", cb)
+        self.aprs.register_observer("CALL-3", _noop)
         # Should not raise
-        self.aprs.unregister_observer("CALL-3", lambda f: None)
+        self.aprs.unregister_observer("CALL-3", _other_noop)
 
     def test_clear_observers(self):
-        cb = lambda f: None
-        self.aprs.register_observer("CALL-4", cb)
+        self.aprs.register_observer("CALL-4", _noop)
         self.aprs.clear_observers()
         self.assertEqual(self.aprs._observers, {})
 
@@ -78,684 +197,271 @@ class TestAprs(unittest.TestCase):
         def cb(frame): called.append(frame)
         self.aprs.register_observer("DEST-1", cb)
         # Frame info must contain ":DEST-1   :" (callsign padded to 9 chars)
-        info = b":DEST-1   :hello"
-        from ax253 import Address
-        frame = Frame(destination=Address(b"X"), source=Address(b"Y"), path=[], info=info)
+        self.aprs._notify_observers(FRAME_DEST_1)
+        self.assertEqual(called[0], FRAME_DEST_1)
+
+    def test_observer_can_unregister_itself(self):
+        called = []
+        def once(frame):
+            called.append(frame)
+            self.aprs.unregister_observer("DEST-1", once)
+        self.aprs.register_observer("DEST-1", once)
+        self.aprs.register_observer("DEST-1", _noop)
+        self.aprs._notify_observers(FRAME_DEST_1)
+        self.aprs._notify_observers(FRAME_DEST_1)
+        self.assertEqual(called, [FRAME_DEST_1])
+        self.assertEqual(list(self.aprs._observers["DEST-1"]), [_noop])
+
+    def test_observer_unregistering_last_callback_for_callsign(self):
+        called = []
+        def once(frame):
+            called.append("DEST-1")
+            self.aprs.unregister_observer("DEST-1", once)
+        self.aprs.register_observer("DEST-1", once)
+        self.aprs.register_observer("DEST-24", lambda frame: called.append("DEST-24"))
+        frame = Frame(
+            destination=ADDR_X, source=ADDR_Y, path=[], info=INFO_DEST_1 + INFO_DEST_24
+        )
+        self.aprs._notify_observers(frame)
+        self.assertEqual(called, ["DEST-1", "DEST-24"])
+        self.assertNotIn("DEST-1", self.aprs._observers)
+
+    def test_notify_observers_non_utf8_info(self):
+        called = []
+        self.aprs.register_observer("DEST-1", called.append)
+        frame = Frame(destination=ADDR_X, source=ADDR_Y, path=[], info=INFO_DEST_1 + b"\xff")
         self.aprs._notify_observers(frame)
-        self.assertEqual(called[0], frame)
+        self.assertEqual(called, [frame])
 
     def test_notify_observers_callback_exception(self):
         def bad_cb(frame): raise RuntimeError("fail")
         self.aprs.register_observer("DEST-2", bad_cb)
-        info = b":DEST-2:hello"
-        from ax253 import Address
-        frame = Frame(destination=Address(b"X"), source=Address(b"Y"), path=[], info=info)
         # Should not raise
-        self.aprs._notify_observers(frame)
+        self.aprs._notify_observers(FRAME_DEST_2_UNPADDED)
 
     def test_get_my_message(self):
-        # Pad CALL-5 to 9 chars for APRS message format
-        info = b":CALL-5   :test message{123"
-        from ax253 import Address
-        frame = Frame(destination=Address(b"X"), source=Address(b"Y"), path=[], info=info)
-        msg = self.aprs.get_my_message("CALL-5", frame)
+        msg = self.aprs.get_my_message("CALL-5", FRAME_CALL_5_MSG)
         self.assertEqual(msg, "test message")
 
     def test_get_my_message_none(self):
-        info = b":OTHER:hello"
-        from ax253 import Address
-        frame = Frame(destination=Address(b"X"), source=Address(b"Y"), path=[], info=info)
-        msg = self.aprs.get_my_message("CALL-6", frame)
+        msg = self.aprs.get_my_message("CALL-6", FRAME_OTHER)
         self.assertIsNone(msg)
 
-    def test_send_my_message_no_ack_success(self):
-        proto = DummyKissProtocol()
-        self.aprs.kiss_protocol = proto
-        self.aprs.initialized = True
-        self.aprs.send_my_message_no_ack(
-            mycall="CALL-9",
-            path=["WIDE1-1"],
-            recipient="DEST-9",
-            message="Hello APRS"
-        )
-        self.assertTrue(proto.written_frames)
-        frame = proto.written_frames[0]
-        self.assertIn(b"Hello APRS", frame.info)
-
-    def test_send_my_message_no_ack_invalid_callsign(self):
-        self.aprs.initialized = True
-        with self.assertRaises(ValueError):
-            self.aprs.send_my_message_no_ack(
-                mycall="BADCALL",
-                path=["WIDE1-1"],
-                recipient="DEST-10",
-                message="Hello"
-            )
-
-    def test_send_my_message_no_ack_invalid_path(self):
-        self.aprs.initialized = True
-        with self.assertRaises(ValueError):
-            self.aprs.send_my_message_no_ack(
-                mycall="CALL-10",
-                path=[""],
-                recipient="DEST-10",
-                message="Hello"
-            )
-
-    def test_send_my_message_no_ack_invalid_message(self):
-        self.aprs.initialized = True
-        with self.assertRaises(ValueError):
-            self.aprs.send_my_message_no_ack(
-                mycall="CALL-11",
-                path=["WIDE1-1"],
-                recipient="DEST-11",
-                message=""
-            )
+    def test_get_my_message_longer_addressee(self):
+        # ":CALL-55  :" is addressed to CALL-55, not CALL-5
+        frame = Frame(destination=ADDR_X, source=ADDR_Y, path=[], info=b":CALL-55  :hi{7")
+        self.assertIsNone(self.aprs.get_my_message("CALL-5", frame))
+        self.assertEqual(self.aprs.get_my_message("CALL-55", frame), "hi")
 
+    def test_send_my_message_no_ack_success(self):
+        self.aprs.send_my_message_no_ack(**{**MESSAGE_BASE, "message": "Hello APRS"})
+        self.assertEqual(len(self.written), 1)
+        frame = self.written[0]
+        self.assertEqual(frame.info, EXPECTED_MESSAGE_INFO)
+
+    MESSAGE_INVALID_CASES = [
+        ("invalid_callsign", {"mycall": "BADCALL"}),
+        ("lowercase_callsign", {"mycall": "call-10"}),
+        ("callsign_trailing_newline", {"mycall": "CALL-10\n"}),
+        ("non_ascii_ssid", {"mycall": "CALL-\u0661"}),
+        ("invalid_path", {"path": [""]}),
+        ("invalid_recipient", {"recipient": "BADRECIP"}),
+        ("path_not_list", {"path": "notalist"}),
+        ("empty_message", {"message": ""}),
+        ("message_not_str", {"message": None}),
+        ("message_too_long", {"message": TOO_LONG_MESSAGE}),
+    ]
+
+    def test_send_my_message_no_ack_invalid(self):
+        for name, overrides in self.MESSAGE_INVALID_CASES:
+            with self.subTest(name=name):
+                with self.assertRaises(ValueError):
+                    self.aprs.send_my_message_no_ack(**{**MESSAGE_BASE, **overrides})
+
+    def test_send_my_message_no_ack_bad_callsigns_and_paths(self):
+        for param in ("mycall", "recipient"):
+            for bad in BAD_CALLSIGNS:
+                with self.subTest(param=param, bad=bad), self.assertRaises(ValueError):
+                    self.aprs.send_my_message_no_ack(**{**MESSAGE_BASE, param: bad})
+        for bad in BAD_PATHS:
+            with self.subTest(param="path", bad=bad), self.assertRaises(ValueError):
+                self.aprs.send_my_message_no_ack(**{**MESSAGE_BASE, "path": bad})
+        self.assertEqual(len(self.written), 0)
+
+    @initialized(False)
     def test_send_my_message_no_ack_not_initialized(self):
-        self.aprs.initialized = False
         with self.assertRaises(AprsError):
-            self.aprs.send_my_message_no_ack(
-                mycall="CALL-12",
-                path=["WIDE1-1"],
-                recipient="DEST-12",
-                message="Hello"
-            )
+            self.aprs.send_my_message_no_ack(**MESSAGE_BASE)
 
     def test_send_my_message_no_ack_write_exception(self):
         class BadProto(DummyKissProtocol):
             def write(self, frame): raise RuntimeError("fail")
         self.aprs.kiss_protocol = BadProto()
-        self.aprs.initialized = True
         with self.assertRaises(AprsError):
-            self.aprs.send_my_message_no_ack(
-                mycall="CALL-13",
-                path=["WIDE1-1"],
-                recipient="DEST-13",
-                message="Hello"
-            )
+            self.aprs.send_my_message_no_ack(**MESSAGE_BASE)
 
     def test_send_object_report_success(self):
-        proto = DummyKissProtocol()
-        self.aprs.kiss_protocol = proto
-        self.aprs.initialized = True
-        self.aprs.send_object_report(
-            mycall="CALL-14",
-            path=["WIDE1-1"],
-            time_dhm="011234z",
-            lat_dmm="5132.07N",
-            long_dmm="00007.40W",
-            symbol_id="/",
-            symbol_code=">",
-            comment="Test object"
-        )
-        self.assertTrue(proto.written_frames)
-        frame = proto.written_frames[0]
-        self.assertIn(b"Test object", frame.info)
+        # A different sender than OBJECT_BASE; checks the frame header too
+        self.aprs.send_object_report(**{**OBJECT_BASE, "mycall": "CALL-14"})
+        self.assertEqual(len(self.written), 1)
+        frame = self.written[0]
+        self.assertEqual(str(frame.source), "CALL-14")
+        self.assertEqual(str(frame.destination), "APDW16")
+        self.assertEqual([str(p) for p in frame.path], ["WIDE1-1"])
+        self.assertEqual(frame.info, b";CALL-14  *011234z5132.07N/00007.40W>Test object")
 
     def test_send_object_report_success_with_name(self):
-        proto = DummyKissProtocol()
-        self.aprs.kiss_protocol = proto
-        self.aprs.initialized = True
-        self.aprs.APRS_SW_VERSION = "APDW16"
-        self.aprs.send_object_report(
-            mycall="CALL-14",
-            path=["WIDE1-1"],
-            time_dhm="011234z",
-            lat_dmm="5132.07N",
-            long_dmm="00007.40W",
-            symbol_id="/",
-            symbol_code=">",
-            comment="Test object",
-            name="OBJNAME"
-        )
-        self.assertTrue(proto.written_frames)
-        frame = proto.written_frames[0]
+        self.aprs.send_object_report(**OBJECT_BASE, name="OBJNAME")
+        self.assertEqual(len(self.written), 1)
+        frame = self.written[0]
         # Object name should be used and padded to 9 chars
-        self.assertIn(b";OBJNAME  *011234z5132.07N/00007.40W>Test object", frame.info)
+        self.assertEqual(frame.info, EXPECTED_NAMED_OBJECT_INFO)
 
     def test_send_object_report_success_without_name(self):
-        proto = DummyKissProtocol()
-        self.aprs.kiss_protocol = proto
-        self.aprs.initialized = True
-        self.aprs.APRS_SW_VERSION = "APDW16"
-        self.aprs.send_object_report(
-            mycall="CALL-15",
-            path=["WIDE1-1"],
-            time_dhm="011234z",
-            lat_dmm="5132.07N",
-            long_dmm="00007.40W",
-            symbol_id="/",
-            symbol_code=">",
-            comment="Test object"
-            # name omitted, should use mycall
-        )
-        self.assertTrue(proto.written_frames)
-        frame = proto.written_frames[0]
-        self.assertIn(b";CALL-15  *011234z5132.07N/00007.40W>Test object", frame.info)
-
-    def test_send_object_report_invalid_name(self):
-        self.aprs.initialized = True
-        # Too long
-        with self.assertRaises(ValueError):
-            self.aprs.send_object_report(
-                mycall="CALL-16",
-                path=["WIDE1-1"],
-                time_dhm="011234z",
-                lat_dmm="5132.07N",
-                long_dmm="00007.40W",
-                symbol_id="/",
-                symbol_code=">",
-                comment="Test object",
-                name="TOOLONGNAME"
-            )
-        # Empty string
-        with self.assertRaises(ValueError):
-            self.aprs.send_object_report(
-                mycall="CALL-17",
-                path=["WIDE1-1"],
-                time_dhm="011234z",
-                lat_dmm="5132.07N",
-                long_dmm="00007.40W",
-                symbol_id="/",
-                symbol_code=">",
-                comment="Test object",
-                name=""
-            )
-
-    def test_send_object_report_invalid_callsign(self):
-        self.aprs.initialized = True
-        with self.assertRaises(ValueError):
-            self.aprs.send_object_report(
-                mycall="BADCALL",
-                path=["WIDE1-1"],
-                time_dhm="011234z",
-                lat_dmm="5132.07N",
-                long_dmm="00007.40W",
-                symbol_id="/",
-                symbol_code=">",
-                comment="Test object"
-            )
-
-    def test_send_object_report_invalid_path(self):
-        self.aprs.initialized = True
-        with self.assertRaises(ValueError):
-            self.aprs.send_object_report(
-                mycall="CALL-15",
-                path=[""],
-                time_dhm="011234z",
-                lat_dmm="5132.07N",
-                long_dmm="00007.40W",
-                symbol_id="/",
-                symbol_code=">",
-                comment="Test object"
-            )
-
-    def test_send_object_report_invalid_time(self):
-        self.aprs.initialized = True
-        with self.assertRaises(ValueError):
-            self.aprs.send_object_report(
-                mycall="CALL-16",
-                path=["WIDE1-1"],
-                time_dhm="01123z",  # Too short
-                lat_dmm="5132.07N",
-                long_dmm="00007.40W",
-                symbol_id="/",
-                symbol_code=">",
-                comment="Test object"
-            )
-
-    def test_send_object_report_invalid_lat(self):
-        self.aprs.initialized = True
-        with self.assertRaises(ValueError):
-            self.aprs.send_object_report(
-                mycall="CALL-17",
-                path=["WIDE1-1"],
-                time_dhm="011234z",
-                lat_dmm="BADLAT",
-                long_dmm="00007.40W",
-                symbol_id="/",
-                symbol_code=">",
-                comment="Test object"
-            )
-
-    def test_send_object_report_invalid_long(self):
-        self.aprs.initialized = True
-        with self.assertRaises(ValueError):
-            self.aprs.send_object_report(
-                mycall="CALL-18",
-                path=["WIDE1-1"],
-                time_dhm="011234z",
-                lat_dmm="5132.07N",
-                long_dmm="BADLONG",
-                symbol_id="/",
-                symbol_code=">",
-                comment="Test object"
-            )
-
-    def test_send_object_report_invalid_symbol_id(self):
-        self.aprs.initialized = True
-        with self.assertRaises(ValueError):
-            self.aprs.send_object_report(
-                mycall="CALL-19",
-                path=["WIDE1-1"],
-                time_dhm="011234z",
-                lat_dmm="5132.07N",
-                long_dmm="00007.40W",
-                symbol_id="XX",
-                symbol_code=">",
-                comment="Test object"
-            )
-
-    def test_send_object_report_invalid_symbol_code(self):
-        self.aprs.initialized = True
-        with self.assertRaises(ValueError):
-            self.aprs.send_object_report(
-                mycall="CALL-20",
-                path=["WIDE1-1"],
-                time_dhm="011234z",
-                lat_dmm="5132.07N",
-                long_dmm="00007.40W",
-                symbol_id="/",
-                symbol_code=">>",
-                comment="Test object"
-            )
-
-    def test_send_object_report_invalid_comment(self):
-        self.aprs.initialized = True
-        with self.assertRaises(ValueError):
-            self.aprs.send_object_report(
-                mycall="CALL-21",
-                path=["WIDE1-1"],
-                time_dhm="011234z",
-                lat_dmm="5132.07N",
-                long_dmm="00007.40W",
-                symbol_id="/",
-                symbol_code=">",
-                comment="X" * 44
-            )
-
+        # name omitted, should use mycall
+        self.aprs.send_object_report(**OBJECT_BASE)
+        self.assertEqual(len(self.written), 1)
+        frame = self.written[0]
+        self.assertEqual(frame.info, EXPECTED_OBJECT_INFO)
+
+    OBJECT_INVALID_CASES = [
+        ("name_too_long", {"name": "TOOLONGNAME"}),
+        ("empty_name", {"name": ""}),
+        ("invalid_callsign", {"mycall": "BADCALL"}),
+        ("invalid_path", {"path": [""]}),
+        ("time_too_short", {"time_dhm": "01123z"}),
+        ("invalid_lat", {"lat_dmm": "BADLAT"}),
+        ("invalid_long", {"long_dmm": "BADLONG"}),
+        ("invalid_symbol_id", {"symbol_id": "XX"}),
+        ("invalid_symbol_code", {"symbol_code": ">>"}),
+        ("comment_too_long", {"comment": TOO_LONG_COMMENT}),
+    ]
+
+    def test_send_object_report_invalid(self):
+        for name, overrides in self.OBJECT_INVALID_CASES:
+            with self.subTest(name=name):
+                with self.assertRaises(ValueError):
+                    self.aprs.send_object_report(**{**OBJECT_BASE, **overrides})
+
+    @initialized(False)
     def test_send_object_report_not_initialized(self):
-        self.aprs.initialized = False
         with self.assertRaises(AprsError):
-            self.aprs.send_object_report(
-                mycall="CALL-22",
-                path=["WIDE1-1"],
-                time_dhm="011234z",
-                lat_dmm="5132.07N",
-                long_dmm="00007.40W",
-                symbol_id="/",
-                symbol_code=">",
-                comment="Test object"
-            )
+            self.aprs.send_object_report(**OBJECT_BASE)
 
     def test_send_object_report_write_exception(self):
         class BadProto(DummyKissProtocol):
             def write(self, frame): raise RuntimeError("fail")
         self.aprs.kiss_protocol = BadProto()
-        self.aprs.initialized = True
         with self.assertRaises(AprsError):
-            self.aprs.send_object_report(
-                mycall="CALL-23",
-                path=["WIDE1-1"],
-                time_dhm="011234z",
-                lat_dmm="5132.07N",
-                long_dmm="00007.40W",
-                symbol_id="/",
-                symbol_code=">",
-                comment="Test object"
-            )
-
-    def test_connect_success(self):
-        aprs = Aprs(host="localhost", port=8001, kiss=self.dummy_kiss)
-        import asyncio
-        asyncio.run(aprs.connect())
-        self.assertTrue(aprs.initialized)
-        self.assertIsInstance(aprs.kiss_protocol, DummyKissProtocol)
-
-    def test_connect_failure(self):
-        class FailingKISS(DummyKISS):
-            async def create_tcp_connection(self, host, port, kiss_settings):
-                raise Exception("fail")
-        aprs = Aprs(host="localhost", port=8001, kiss=FailingKISS())
-        import asyncio
-        with self.assertRaises(AprsError):
-            asyncio.run(aprs.connect())
+            self.aprs.send_object_report(**OBJECT_BASE)
 
-    def test_run_not_initialized(self):
-        aprs = Aprs(host="localhost", port=8001, kiss=self.dummy_kiss)
-        with self.assertRaises(AprsError):
-            import asyncio
-            asyncio.run(aprs.run())
-
-    def test_run_loop_and_cancel(self):
-        proto = DummyKissProtocol()
-        # Pad DEST-24 to 9 chars for APRS message format
-        info = b":DEST-24  :hello"
-        from ax253 import Address
-        frame = Frame(destination=Address(b"X"), source=Address(b"Y"), path=[], info=info)
-        proto.read_frames.append(frame)
-        aprs = Aprs(host="localhost", port=8001, kiss=self.dummy_kiss)
-        aprs.kiss_protocol = proto
-        aprs.transport = object()
-        aprs.initialized = True
-        called = []
-        aprs.register_observer("DEST-24", lambda f: called.append(f))
-        import asyncio
-        async def run_and_cancel():
-            task = asyncio.create_task(aprs.run())
-            await asyncio.sleep(0.01)
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
-        asyncio.run(run_and_cancel())
-        self.assertTrue(called)
+    def test_ui_frame_matches_frame_ui(self):
+        for path in ([], ["WIDE1-1"], ["WIDE1-1", "WIDE2-1"]):
+            with self.subTest(path=path):
+                expected = Frame.ui(destination="APDW16", source="CALL-1", path=path, info=b">hi")
+                frame = _ui_frame("APDW16", "CALL-1", path, b">hi")
+                self.assertEqual(frame, expected)
+                self.assertEqual(bytes(frame), bytes(expected))
 
     def test_send_ack_if_requested(self):
-        proto = DummyKissProtocol()
-        self.aprs.kiss_protocol = proto
-        self.aprs.initialized = True
-        info = b":CALL-7     :test{42"
-        from ax253 import Address
-        frame = Frame(destination=Address(b"X"), source=Address(b"SRC"), path=[], info=info)
-        self.aprs.send_ack_if_requested(frame, "MYCALL-1", ["WIDE1-1"])
-        self.assertTrue(proto.written_frames)
-        ack_frame = proto.written_frames[0]
-        self.assertIn(b":ack42", ack_frame.info)
+        self.aprs.send_ack_if_requested(FRAME_CALL_7_ACK_REQ, "MYCALL-1", ["WIDE1-1"])
+        self.assertEqual(len(self.written), 1)
+        ack_frame = self.written[0]
+        self.assertEqual(ack_frame.info, EXPECTED_ACK_INFO)
 
+    @initialized(False)
     def test_send_ack_if_requested_not_initialized(self):
-        self.aprs.initialized = False
-        info = b":CALL-8     :test{42"
-        from ax253 import Address
-        frame = Frame(destination=Address(b"X"), source=Address(b"SRC"), path=[], info=info)
         # Should not raise
-        self.aprs.send_ack_if_requested(frame, "MYCALL-2", ["WIDE1-1"])
+        self.aprs.send_ack_if_requested(FRAME_CALL_8_ACK_REQ, "MYCALL-2", ["WIDE1-1"])
 
     def test_send_position_report_success_with_time(self):
-        proto = DummyKissProtocol()
-        self.aprs.kiss_protocol = proto
-        self.aprs.initialized = True
-        self.aprs.APRS_SW_VERSION = "APDW16"
         self.aprs.send_position_report(
-            mycall="CALL-30",
-            path=["WIDE1-1"],
-            lat="5132.07N",  # was lat_dmm
-            lon="00007.40W",  # was long_dmm
-            symbol_id="/",
-            symbol_code=">",
-            comment="Test position",
-            time_dhm="011234z"
+            **{**POSITION_BASE, "comment": "Test position"}, time_dhm="011234z"
         )
-        self.assertTrue(proto.written_frames)
-        frame = proto.written_frames[0]
-        self.assertIn(b"/011234z5132.07N/00007.40W>Test position", frame.info)
+        self.assertEqual(len(self.written), 1)
+        frame = self.written[0]
+        self.assertEqual(frame.info, EXPECTED_TIMED_POSITION_INFO)
 
     def test_send_position_report_success_without_time(self):
-        proto = DummyKissProtocol()
-        self.aprs.kiss_protocol = proto
-        self.aprs.initialized = True
-        self.aprs.APRS_SW_VERSION = "APDW16"
-        self.aprs.send_position_report(
-            mycall="CALL-31",
-            path=["WIDE1-1"],
-            lat="5132.07N",  # was lat_dmm
-            lon="00007.40W",  # was long_dmm
-            symbol_id="/",
-            symbol_code=">",
-            comment="No time"
-            # time_dhm omitted
-        )
-        self.assertTrue(proto.written_frames)
-        frame = proto.written_frames[0]
-        self.assertIn(b"!5132.07N/00007.40W>No time", frame.info)
-
-    def test_send_position_report_invalid_time(self):
-        self.aprs.initialized = True
-        with self.assertRaises(ValueError):
-            self.aprs.send_position_report(
-                mycall="CALL-32",
-                path=["WIDE1-1"],
-                lat="5132.07N",
-                lon="00007.40W",
-                symbol_id="/",
-                symbol_code=">",
-                comment="Bad time",
-                time_dhm="01123z"  # Too short
-            )
-
-    def test_send_position_report_invalid_lat(self):
-        self.aprs.initialized = True
-        with self.assertRaises(ValueError):
-            self.aprs.send_position_report(
-                mycall="CALL-33",
-                path=["WIDE1-1"],
-                lat="BADLAT",
-                lon="00007.40W",
-                symbol_id="/",
-                symbol_code=">",
-                comment="Bad lat"
-            )
-
-    def test_send_position_report_invalid_long(self):
-        self.aprs.initialized = True
-        with self.assertRaises(ValueError):
-            self.aprs.send_position_report(
-                mycall="CALL-34",
-                path=["WIDE1-1"],
-                lat="5132.07N",
-                lon="BADLONG",
-                symbol_id="/",
-                symbol_code=">",
-                comment="Bad long"
-            )
-
-    def test_send_position_report_invalid_symbol_id(self):
-        self.aprs.initialized = True
-        with self.assertRaises(ValueError):
-            self.aprs.send_position_report(
-                mycall="CALL-35",
-                path=["WIDE1-1"],
-                lat="5132.07N",
-                lon="00007.40W",
-                symbol_id="XX",
-                symbol_code=">",
-                comment="Bad symbol id"
-            )
-
-    def test_send_position_report_invalid_symbol_code(self):
-        self.aprs.initialized = True
-        with self.assertRaises(ValueError):
-            self.aprs.send_position_report(
-                mycall="CALL-36",
-                path=["WIDE1-1"],
-                lat="5132.07N",
-                lon="00007.40W",
-                symbol_id="/",
-                symbol_code=">>",
-                comment="Bad symbol code"
-            )
-
-    def test_send_position_report_invalid_comment(self):
-        self.aprs.initialized = True
-        with self.assertRaises(ValueError):
-            self.aprs.send_position_report(
-                mycall="CALL-37",
-                path=["WIDE1-1"],
-                lat="5132.07N",
-                lon="00007.40W",
-                symbol_id="/",
-                symbol_code=">",
-                comment="X" * 44
-            )
+        # time_dhm omitted
+        self.aprs.send_position_report(**{**POSITION_BASE, "comment": "No time"})
+        self.assertEqual(len(self.written), 1)
+        frame = self.written[0]
+        self.assertEqual(frame.info, EXPECTED_POSITION_INFO)
+
+    POSITION_INVALID_CASES = [
+        ("invalid_callsign", {"mycall": "BADCALL"}),
+        ("time_too_short", {"time_dhm": "01123z"}),
+        ("invalid_lat", {"lat": "BADLAT"}),
+        ("invalid_long", {"lon": "BADLONG"}),
+        ("invalid_symbol_id", {"symbol_id": "XX"}),
+        ("invalid_symbol_code", {"symbol_code": ">>"}),
+        ("comment_too_long", {"comment": TOO_LONG_COMMENT}),
+        ("compressed_non_numeric", {"lat": "notafloat", "lon": "notafloat", "compressed": True}),
+    ]
+
+    def test_send_position_report_invalid(self):
+        for name, overrides in self.POSITION_INVALID_CASES:
+            with self.subTest(name=name):
+                with self.assertRaises(ValueError):
+                    self.aprs.send_position_report(**{**POSITION_BASE, **overrides})
 
     def test_send_position_report_write_exception(self):
         class BadProto(DummyKissProtocol):
             def write(self, frame): raise RuntimeError("fail")
         self.aprs.kiss_protocol = BadProto()
-        self.aprs.initialized = True
         with self.assertRaises(AprsError):
-            self.aprs.send_position_report(
-                mycall="CALL-39",
-                path=["WIDE1-1"],
-                lat="5132.07N",
-                lon="00007.40W",
-                symbol_id="/",
-                symbol_code=">",
-                comment="Test"
-            )
+            self.aprs.send_position_report(**POSITION_BASE)
 
     def test_send_status_report_success_with_time(self):
-        proto = DummyKissProtocol()
-        self.aprs.kiss_protocol = proto
-        self.aprs.initialized = True
-        self.aprs.APRS_SW_VERSION = "APDW16"
         self.aprs.send_status_report(
-            mycall="CALL-40",
-            path=["WIDE1-1"],
-            status="Net Control Center",
-            time_dhm="092345z"
+            **{**STATUS_BASE, "status": "Net Control Center"}, time_dhm="092345z"
         )
-        self.assertTrue(proto.written_frames)
-        frame = proto.written_frames[0]
-        self.assertIn(b">092345zNet Control Center", frame.info)
+        self.assertEqual(len(self.written), 1)
+        frame = self.written[0]
+        self.assertEqual(frame.info, EXPECTED_TIMED_STATUS_INFO)
 
     def test_send_status_report_success_without_time(self):
-        proto = DummyKissProtocol()
-        self.aprs.kiss_protocol = proto
-        self.aprs.initialized = True
-        self.aprs.APRS_SW_VERSION = "APDW16"
-        self.aprs.send_status_report(
-            mycall="CALL-41",
-            path=["WIDE1-1"],
-            status="Mission started"
-            # time_dhm omitted
-        )
-        self.assertTrue(proto.written_frames)
-        frame = proto.written_frames[0]
-        self.assertIn(b">Mission started", frame.info)
-
-    def test_send_status_report_invalid_time(self):
-        self.aprs.initialized = True
-        with self.assertRaises(ValueError):
-            self.aprs.send_status_report(
-                mycall="CALL-42",
-                path=["WIDE1-1"],
-                status="Bad time",
-                time_dhm="09234z"  # Too short
-            )
-
-    def test_send_status_report_invalid_status_too_long(self):
-        self.aprs.initialized = True
-        # 63 chars, should fail (max 62 without time)
-        with self.assertRaises(ValueError):
-            self.aprs.send_status_report(
-                mycall="CALL-43",
-                path=["WIDE1-1"],
-                status="X" * 63
-            )
-        # 56 chars, should fail (max 55 with time)
-        with self.assertRaises(ValueError):
-            self.aprs.send_status_report(
-                mycall="CALL-44",
-                path=["WIDE1-1"],
-                status="X" * 56,
-                time_dhm="092345z"
-            )
-
-    def test_send_status_report_invalid_status_chars(self):
-        self.aprs.initialized = True
-        with self.assertRaises(ValueError):
-            self.aprs.send_status_report(
-                mycall="CALL-45",
-                path=["WIDE1-1"],
-                status="Bad|status"
-            )
-        with self.assertRaises(ValueError):
-            self.aprs.send_status_report(
-                mycall="CALL-46",
-                path=["WIDE1-1"],
-                status="Bad~status"
-            )
-
+        # time_dhm omitted
+        self.aprs.send_status_report(**{**STATUS_BASE, "status": "Mission started"})
+        self.assertEqual(len(self.written), 1)
+        frame = self.written[0]
+        self.assertEqual(frame.info, EXPECTED_STATUS_INFO)
+
+    STATUS_INVALID_CASES = [
+        ("time_too_short", {"status": "Bad time", "time_dhm": "09234z"}),
+        # Max 62 chars without time, 55 with time
+        ("too_long_without_time", {"status": TOO_LONG_STATUS}),
+        ("too_long_with_time", {"status": TOO_LONG_TIMED_STATUS, "time_dhm": "092345z"}),
+        ("pipe_char", {"status": "Bad|status"}),
+        ("tilde_char", {"status": "Bad~status"}),
+    ]
+
+    def test_send_status_report_invalid(self):
+        for name, overrides in self.STATUS_INVALID_CASES:
+            with self.subTest(name=name):
+                with self.assertRaises(ValueError):
+                    self.aprs.send_status_report(**{**STATUS_BASE, **overrides})
+
+    @initialized(False)
     def test_send_status_report_not_initialized(self):
-        self.aprs.initialized = False
         with self.assertRaises(AprsError):
-            self.aprs.send_status_report(
-                mycall="CALL-47",
-                path=["WIDE1-1"],
-                status="Test"
-            )
+            self.aprs.send_status_report(**STATUS_BASE)
 
     def test_send_status_report_write_exception(self):
         class BadProto(DummyKissProtocol):
             def write(self, frame): raise RuntimeError("fail")
         self.aprs.kiss_protocol = BadProto()
-        self.aprs.initialized = True
         with self.assertRaises(AprsError):
-            self.aprs.send_status_report(
-                mycall="CALL-48",
-                path=["WIDE1-1"],
-                status="Test"
-            )
-
-    def test_send_my_message_no_ack_invalid_recipient(self):
-        self.aprs.initialized = True
-        with self.assertRaises(ValueError):
-            self.aprs.send_my_message_no_ack(
-                mycall="CALL-10",
-                path=["WIDE1-1"],
-                recipient="BADRECIP",
-                message="Hello"
-            )
-
-    def test_send_my_message_no_ack_invalid_path_type(self):
-        self.aprs.initialized = True
-        with self.assertRaises(ValueError):
-            self.aprs.send_my_message_no_ack(
-                mycall="CALL-11",
-                path="notalist",
-                recipient="DEST-11",
-                message="Hello"
-            )
-
-    def test_send_my_message_no_ack_invalid_message_type(self):
-        self.aprs.initialized = True
-        with self.assertRaises(ValueError):
-            self.aprs.send_my_message_no_ack(
-                mycall="CALL-12",
-                path=["WIDE1-1"],
-                recipient="DEST-12",
-                message=None  # type: ignore
-            )
-
-    def test_send_my_message_no_ack_message_too_long(self):
-        self.aprs.initialized = True
-        with self.assertRaises(ValueError):
-            self.aprs.send_my_message_no_ack(
-                mycall="CALL-13",
-                path=["WIDE1-1"],
-                recipient="DEST-13",
-                message="X" * 68
-            )
+            self.aprs.send_status_report(**STATUS_BASE)
 
     def test_send_my_message_no_ack_message_min_length(self):
-        proto = DummyKissProtocol()
-        self.aprs.kiss_protocol = proto
-        self.aprs.initialized = True
-        self.aprs.send_my_message_no_ack(
-            mycall="CALL-14",
-            path=["WIDE1-1"],
-            recipient="DEST-14",
-            message="A"
-        )
-        self.assertTrue(proto.written_frames)
-        frame = proto.written_frames[0]
+        self.aprs.send_my_message_no_ack(**{**MESSAGE_BASE, "message": "A"})
+        self.assertEqual(len(self.written), 1)
+        frame = self.written[0]
         self.assertIn(b"A", frame.info)
 
     def test_send_position_report_standard(self):
-        self.aprs.initialized = True
         self.aprs.kiss_protocol = self.aprs.kiss  # Use dummy
         self.aprs.send_position_report(
             mycall="5B4AON-9",
@@ -777,7 +483,6 @@ class TestAprs(unittest.TestCase):
         )
 
     def test_send_position_report_compressed(self):
-        self.aprs.initialized = True
         self.aprs.kiss_protocol = self.aprs.kiss  # Use dummy
         self.aprs.send_position_report(
             mycall="5B4AON-9",
@@ -800,44 +505,52 @@ class TestAprs(unittest.TestCase):
         base91_part = info[10+1:10+1+8]  # after /011234z and symbol_id
         self.assertEqual(len(base91_part), 8)
 
-    def test_send_position_report_invalid_callsign(self):
-        self.aprs.initialized = True
-        self.aprs.kiss_protocol = self.aprs.kiss
-        with self.assertRaises(ValueError):
-            self.aprs.send_position_report(
-                mycall="BADCALL",
-                path=["WIDE1-1"],
-                lat="3511.14N",
-                lon="03322.94E",
-                symbol_id="/",
-                symbol_code=">",
-                comment="Test",
-            )
-
-    def test_send_position_report_invalid_latlon_for_compressed(self):
-        self.aprs.initialized = True
-        self.aprs.kiss_protocol = self.aprs.kiss
-        with self.assertRaises(ValueError):
-            self.aprs.send_position_report(
-                mycall="5B4AON-9",
-                path=["WIDE1-1"],
-                lat="notafloat",
-                lon="notafloat",
-                symbol_id="/",
-                symbol_code=">",
-                comment="Test",
-                compressed=True,
-            )
-
+    @initialized(False)
     def test_send_position_report_not_initialized(self):
-        self.aprs.initialized = False
         with self.assertRaises(AprsError):
-            self.aprs.send_position_report(
-                mycall="5B4AON-9",
-                path=["WIDE1-1"],
-                lat="3511.14N",
-                lon="03322.94E",
-                symbol_id="/",
-                symbol_code=">",
-                comment="Test",
-            )
\ No newline at end of file
+            self.aprs.send_position_report(**POSITION_BASE)
+
+class TestAprsAsync(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.dummy_kiss = DummyKISS()
+
+    async def test_connect_success(self):
+        aprs = Aprs(host="localhost", port=8001, kiss=self.dummy_kiss)
+        await aprs.connect()
+        self.assertTrue(aprs.initialized)
+        self.assertIsInstance(aprs.kiss_protocol, DummyKissProtocol)
+
+    async def test_connect_failure(self):
+        class FailingKISS(DummyKISS):
+            async def create_tcp_connection(self, host, port, kiss_settings):
+                raise Exception("fail")
+        aprs = Aprs(host="localhost", port=8001, kiss=FailingKISS())
+        with self.assertRaises(AprsError):
+            await aprs.connect()
+
+    async def test_run_not_initialized(self):
+        aprs = Aprs(host="localhost", port=8001, kiss=self.dummy_kiss)
+        with self.assertRaises(AprsError):
+            await aprs.run()
+
+    async def test_run_loop_and_cancel(self):
+        proto = DummyKissProtocol()
+        proto.read_frames.append(FRAME_DEST_24)
+        aprs = Aprs(host="localhost", port=8001, kiss=self.dummy_kiss)
+        aprs.kiss_protocol = proto
+        aprs.transport = object()
+        aprs.initialized = True
+        called = []
+        done = asyncio.Event()
+        def observer(f):
+            called.append(f)
+            done.set()
+        aprs.register_observer("DEST-24", observer)
+        task = asyncio.create_task(aprs.run())
+        await asyncio.wait_for(done.wait(), timeout=1.0)
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        self.assertTrue(called)
@@ -2,8 +2,10 @@ import unittest
 from aprsrover.compass import Compass, CompassError, DummyCompassBackend
 
 class TestDummyCompassBackend(unittest.TestCase):
-    def setUp(self) -> None:
-        self.backend = DummyCompassBackend()
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Stateless dummy, shared by every test in the class
+        cls.backend = DummyCompassBackend()
 
     def test_read(self):
         heading = self.backend.read()
@@ -12,8 +14,10 @@ class TestDummyCompassBackend(unittest.TestCase):
         self.assertLessEqual(heading, 360.0)
 
 class TestCompassWithDummy(unittest.TestCase):
-    def setUp(self) -> None:
-        self.compass = Compass(backend=DummyCompassBackend())
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Compass keeps no state between reads, so one instance serves all tests
+        cls.compass = Compass(backend=DummyCompassBackend())
 
     def test_read(self):
         heading = self.compass.read()
@@ -25,17 +29,6 @@ class TestCompassWithDummy(unittest.TestCase):
             heading = next(gen)
             self.assertEqual(heading, 123.4)
 
-    def test_monitor_async(self):
-        import asyncio
-        async def run_monitor():
-            count = 0
-            async for heading in self.compass.monitor_async(interval=0.01):
-                self.assertEqual(heading, 123.4)
-                count += 1
-                if count >= 3:
-                    break
-        asyncio.run(run_monitor())
-
     def test_no_backend_import_error(self):
         # Only run if smbus2 is not installed
         try:
@@ -47,5 +40,18 @@ class TestCompassWithDummy(unittest.TestCase):
             with self.assertRaises(CompassError):
                 Compass(backend=None).read()
 
+class TestCompassAsync(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.compass = Compass(backend=DummyCompassBackend())
+
+    async def test_monitor_async(self):
+        count = 0
+        async for heading in self.compass.monitor_async(interval=0.01):
+            self.assertEqual(heading, 123.4)
+            count += 1
+            if count >= 3:
+                break
+
 if __name__ == "__main__":
     unittest.main()
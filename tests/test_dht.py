@@ -2,8 +2,10 @@ import unittest
 from aprsrover.dht import DHT, DHTError, DummyDHTBackend
 
 class TestDummyDHTBackend(unittest.TestCase):
-    def setUp(self) -> None:
-        self.backend = DummyDHTBackend()
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Stateless dummy, shared by every test in the class
+        cls.backend = DummyDHTBackend()
 
     def test_read(self):
         temp, humidity = self.backend.read()
@@ -15,8 +17,10 @@ class TestDummyDHTBackend(unittest.TestCase):
         self.assertLessEqual(humidity, 100.0)
 
 class TestDHTWithDummy(unittest.TestCase):
-    def setUp(self) -> None:
-        self.dht = DHT(sensor_type='DHT22', pin=4, backend=DummyDHTBackend())
+    @classmethod
+    def setUpClass(cls) -> None:
+        # DHT keeps no state between reads, so one instance serves all tests
+        cls.dht = DHT(sensor_type='DHT22', pin=4, backend=DummyDHTBackend())
 
     def test_read(self):
         temp, humidity = self.dht.read()
@@ -28,17 +32,6 @@ class TestDHTWithDummy(unittest.TestCase):
             temp, humidity = next(gen)
             self.assertEqual((temp, humidity), (22.5, 55.0))
 
-    def test_monitor_async(self):
-        import asyncio
-        async def run_monitor():
-            count = 0
-            async for temp, humidity in self.dht.monitor_async(interval=0.01):
-                self.assertEqual((temp, humidity), (22.5, 55.0))
-                count += 1
-                if count >= 3:
-                    break
-        asyncio.run(run_monitor())
-
     def test_invalid_sensor_type(self):
         dht = DHT(sensor_type='INVALID', pin=4, backend=DummyDHTBackend())
         # Should not raise, since dummy backend is used
@@ -55,5 +48,18 @@ class TestDHTWithDummy(unittest.TestCase):
             with self.assertRaises(DHTError):
                 DHT(sensor_type='DHT22', pin=4, backend=None).read()
 
+class TestDHTAsync(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.dht = DHT(sensor_type='DHT22', pin=4, backend=DummyDHTBackend())
+
+    async def test_monitor_async(self):
+        count = 0
+        async for temp, humidity in self.dht.monitor_async(interval=0.01):
+            self.assertEqual((temp, humidity), (22.5, 55.0))
+            count += 1
+            if count >= 3:
+                break
+
 if __name__ == "__main__":
     unittest.main()
@@ -43,8 +43,50 @@ class TestGPS(unittest.TestCase):
         self.assertEqual(GPS.decimal_to_dmm(-0.1234, False), "00007.40W")
         self.assertEqual(GPS.decimal_to_dmm(0.1234, False), "00007.40E")
 
+    def test_decimal_to_dmm_batch(self):
+        self.assertEqual(GPS.decimal_to_dmm_batch([51.5345, -0.1234]), ["5132.07N", "0007.40S"])
+        self.assertEqual(
+            GPS.decimal_to_dmm_batch(iter([-0.1234, -179.5]), is_latitude=False),
+            ["00007.40W", "17930.00W"],
+        )
+        self.assertEqual(GPS.decimal_to_dmm_batch([]), [])
+
     def test_iso_to_ddhhmmz(self):
         self.assertEqual(GPS.iso_to_ddhhmmz("2024-01-01T12:34:56.000Z"), "011234z")
+        self.assertEqual(GPS.iso_to_ddhhmmz("2024-12-31T23:59:59Z"), "312359z")
+        self.assertEqual(GPS.iso_to_ddhhmmz("2024-02-29T06:07:08.5Z"), "290607z")
+        # Leap second
+        self.assertEqual(GPS.iso_to_ddhhmmz("2016-12-31T23:59:60.000Z"), "312359z")
+
+    def test_iso_to_ddhhmmz_invalid(self):
+        for bad in (
+            "",
+            "2024-01-01",
+            "2024-01-01 12:34:56.000Z",
+            "2024/01/01T12:34:56.000Z",
+            "2024-01-0xT12:34:56.000Z",
+            "2024-01-00T12:34:56.000Z",
+            "2024-01-32T12:34:56.000Z",
+            "2024-01-01T24:34:56.000Z",
+            "2024-01-01T12:60:56.000Z",
+            "2024-01-\u0661\u0661T12:34:56.000Z",
+            "2024-13-01T12:34:56.000Z",
+            "2024-00-01T12:34:56.000Z",
+            "2024-02-30T12:34:56.000Z",
+            "2023-02-29T12:34:56.000Z",
+            "2024-04-31T12:34:56.000Z",
+            "2024-01-01T12:34:61.000Z",
+            "2024-01-01T12:34:5x.000Z",
+            "2024-01-01T12:34:56",
+            "2024-01-01T12:34:56.000",
+            "2024-01-01T12:34:56.Z",
+            "2024-01-01T12:34:56.1234567Z",
+            "2024-01-01T12:34:56.000Zjunk",
+            "2024-01-01T12:34:56+00:00",
+            "20x4-01-01T12:34:56.000Z",
+        ):
+            with self.subTest(bad=bad), self.assertRaises(ValueError):
+                GPS.iso_to_ddhhmmz(bad)
 
     def test_normalize_bearing(self):
         self.assertEqual(GPS.normalize_bearing(12.3), "012")
@@ -52,6 +94,9 @@ class TestGPS(unittest.TestCase):
         self.assertEqual(GPS.normalize_bearing(360.0), "000")
         self.assertEqual(GPS.normalize_bearing(180.6), "181")
         self.assertEqual(GPS.normalize_bearing(180.5), "180")
+        self.assertEqual(GPS.normalize_bearing(181.5), "182")
+        self.assertEqual(GPS.normalize_bearing(-10.2), "350")
+        self.assertEqual(GPS.normalize_bearing(725), "005")
 
     def test_get_gps_data_dmm_success(self):
         gps = GPS(gpsd=DummyGPSD(DummyPacket(
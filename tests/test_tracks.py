@@ -4,12 +4,13 @@ import unittest
 import time
 import logging
 import asyncio
+import threading
 
 logging.basicConfig(level=logging.WARNING)
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'src')))
 
-from aprsrover.tracks import Tracks, TracksError, PWMControllerInterface
+from aprsrover.tracks import Tracks, TracksError, PWMControllerInterface, _ramp_schedule
 
 class DummyPWM(PWMControllerInterface):
     def __init__(self):
@@ -22,6 +23,33 @@ class DummyPWM(PWMControllerInterface):
     def set_pwm_freq(self, freq: int) -> None:
         self.freq = freq
 
+class DummyI2CDevice:
+    def __init__(self):
+        self.registers = {0x00: 0x01}
+        self.block_writes = []
+
+    def readU8(self, register: int) -> int:
+        return self.registers.get(register, 0)
+
+    def write8(self, register: int, value: int) -> None:
+        self.registers[register] = value
+
+    def writeList(self, register: int, data: list) -> None:
+        self.block_writes.append((register, list(data)))
+
+class DummyPCA9685(DummyPWM):
+    def __init__(self):
+        super().__init__()
+        self._device = DummyI2CDevice()
+
+class DummyBulkPWM(DummyPWM):
+    def __init__(self):
+        super().__init__()
+        self.multi_calls = []
+
+    def set_pwm_multi(self, writes):
+        self.multi_calls.append(list(writes))
+
 class TestTracks(unittest.TestCase):
     def setUp(self) -> None:
         self.dummy_pwm = DummyPWM()
@@ -33,6 +61,25 @@ class TestTracks(unittest.TestCase):
         self.assertEqual(self.tracks.left_channel, Tracks.DEFAULT_LEFT_CHANNEL)
         self.assertEqual(self.tracks.left_channel_reverse, Tracks.DEFAULT_LEFT_CHANNEL_REVERSE)
 
+    def test_default_controller_module_cached(self):
+        import types
+        fake = types.ModuleType("Adafruit_PCA9685")
+        fake.PCA9685 = DummyPWM
+        orig_module = sys.modules.get("Adafruit_PCA9685")
+        sys.modules["Adafruit_PCA9685"] = fake
+        try:
+            self.assertIsInstance(Tracks().pwm, DummyPWM)
+            self.assertIs(Tracks._pca_module, fake)
+            # Later instances reuse the cached module
+            del sys.modules["Adafruit_PCA9685"]
+            self.assertIsInstance(Tracks().pwm, DummyPWM)
+        finally:
+            Tracks._pca_module = None
+            if orig_module is not None:
+                sys.modules["Adafruit_PCA9685"] = orig_module
+            else:
+                sys.modules.pop("Adafruit_PCA9685", None)
+
     def test_init_failure(self):
         class FailingPWM(DummyPWM):
             def set_pwm_freq(self, freq: int) -> None:
@@ -74,6 +121,20 @@ class TestTracks(unittest.TestCase):
         self.tracks.set_right_track_speed(-30)
         self.assertEqual(self.dummy_pwm.calls[-1][2], self.tracks.get_pwm_fw_speed(30))
 
+    def test_set_track_speed_skips_unchanged_pwm(self):
+        self.tracks.set_left_track_speed(50)
+        self.tracks.set_left_track_speed(50)
+        self.assertEqual(len(self.dummy_pwm.calls), 1)
+        # A different channel is a different register, so it must be written
+        self.tracks.left_channel = 5
+        self.tracks.set_left_track_speed(50)
+        self.assertEqual(len(self.dummy_pwm.calls), 2)
+        self.assertEqual(self.dummy_pwm.calls[-1][0], 5)
+        # Re-initializing the controller forgets the cached values
+        self.tracks.init()
+        self.tracks.set_left_track_speed(50)
+        self.assertEqual(len(self.dummy_pwm.calls), 3)
+
     def test_set_left_track_speed_pwm_exception(self):
         # Simulate hardware failure
         def fail_set_pwm(channel, on, off):
@@ -109,6 +170,18 @@ class TestTracks(unittest.TestCase):
                 self.tracks.sanitize_duration("notanumber")
             self.assertTrue(any("Could not convert duration value" in msg for msg in cm.output))
 
+    def test_validate_motion_params(self):
+        # Default interval without accel takes the fast path
+        self.assertEqual(self.tracks._validate_motion_params(1.0, None, 0.05), (1.0, None, 0.05))
+        # Non-default values are still cast and validated
+        self.assertEqual(self.tracks._validate_motion_params(1.0, "50", "0.1"), (1.0, 50.0, 0.1))
+        with self.assertRaises(TracksError):
+            self.tracks._validate_motion_params(1.0, None, 0)
+        with self.assertRaises(TracksError):
+            self.tracks._validate_motion_params(1.0, None, "bad")
+        with self.assertRaises(TracksError):
+            self.tracks._validate_motion_params(1.0, 2000, 0.05)
+
     def test_move_and_stop(self):
         orig_sleep = time.sleep
         time.sleep = lambda x: None
@@ -133,6 +206,285 @@ class TestTracks(unittest.TestCase):
         self.assertEqual(self.tracks.get_left_track_speed(), 0)
         self.assertEqual(self.tracks.get_right_track_speed(), 0)
 
+    def test_ramp_schedule_integer_rounding(self):
+        left, right = _ramp_schedule(-30, 50, 10, -11, 3)
+        self.assertEqual(left, (-3, 23, 50))
+        self.assertEqual(right, (3, -4, -11))
+        for value in left + right:
+            self.assertIsInstance(value, int)
+
+    def test_move_with_accel_ramps_speeds(self):
+        orig_sleep = time.sleep
+        time.sleep = lambda x: None
+        try:
+            # 100%/s with 0.1s steps ramps 10% per step: 4 steps to reach 40
+            self.tracks.move(40, -40, duration=1, accel=100, accel_interval=0.1)
+        finally:
+            time.sleep = orig_sleep
+
+        def expected(speeds, setter_name):
+            ref = Tracks(pwm=DummyPWM())
+            for v in speeds:
+                getattr(ref, setter_name)(v)
+            return [off for _, _, off in ref.pwm.calls]
+
+        def written(channel):
+            offs = [off for ch, _, off in self.dummy_pwm.calls if ch == channel]
+            return [off for i, off in enumerate(offs) if i == 0 or offs[i - 1] != off]
+
+        self.assertEqual(
+            written(self.tracks.left_channel),
+            expected([10, 20, 30, 40, 0], "set_left_track_speed"),
+        )
+        self.assertEqual(
+            written(self.tracks.right_channel),
+            expected([-10, -20, -30, -40, 0], "set_right_track_speed"),
+        )
+        self.assertEqual(self.tracks.get_left_track_speed(), 0)
+        self.assertEqual(self.tracks.get_right_track_speed(), 0)
+
+    def test_move_with_profiles(self):
+        steps = []
+        orig_write = self.tracks._write_pwm
+        def record(left, right):
+            steps.append(left)
+            orig_write(left, right)
+        self.tracks._write_pwm = record
+        orig_sleep = time.sleep
+        time.sleep = lambda x: None
+        try:
+            # Ramp up 20% per step, cruise, then ramp down to a stop by the end of the move
+            self.tracks.move(
+                40, 40, duration=0.8, accel=200, accel_interval=0.1, stop_at_end=False,
+                profile="trapezoid",
+            )
+            self.assertEqual(steps, [20, 40, 40, 40, 40, 40, 20, 0, 0])
+            self.assertEqual(self.tracks.get_left_track_speed(), 0)
+            # Constant-jerk S-curve ramps take 4/3 the steps to keep the peak acceleration at accel
+            steps.clear()
+            self.tracks.move(
+                40, 40, duration=0.8, accel=200, accel_interval=0.1, stop_at_end=False,
+                profile="scurve",
+            )
+            self.assertEqual(steps, [11, 29, 40, 40, 40, 29, 11, 0, 0])
+        finally:
+            time.sleep = orig_sleep
+        with self.assertRaises(TracksError):
+            self.tracks.move(40, 40, duration=1, accel=100, profile="bogus")
+
+    def test_plan_ramp_exact_multiple_of_float_step(self):
+        # accel * interval = 0.15000000000000002: a delta of 3 is exactly 20 steps
+        for target, steps in ((3, 20), (6, 40)):
+            with self.subTest(target=target):
+                left, right = self.tracks._plan_ramp(target, target, 2.0, 5, 0.03, "linear")
+                self.assertEqual(len(left), steps)
+                self.assertEqual(left[-1], target)
+
+    def test_plan_ramp_trapezoid_exact_multiple_of_float_step(self):
+        # 20 steps up to 3 and 20 steps back down, at step_size 0.15000000000000002
+        left, right = self.tracks._plan_ramp(3, 3, 2.0, 5, 0.03, "trapezoid")
+        up, _ = _ramp_schedule(0, 3, 0, 3, 20)
+        down, _ = _ramp_schedule(3, 0, 3, 0, 20)
+        total_steps = int(2.0 / 0.03)
+        self.assertEqual(left, up + (3,) * (total_steps - 40) + down)
+        self.assertEqual(right, left)
+
+    def test_plan_ramp_short_distance_keeps_accel(self):
+        # Too short to reach 100% at 50%/s: the peak is lowered instead of speeding up the ramps
+        cm_per_percent = self.tracks.base_distance / self.tracks.base_duration / self.tracks.base_speed
+        for profile in ("trapezoid", "scurve"):
+            for distance in (5.0, 10.0):
+                with self.subTest(profile=profile, distance=distance):
+                    args = self.tracks._validate_move_args(100, 100, None, distance, 50, 0.05, profile)
+                    left, right = self.tracks._plan_ramp(*args, profile)
+                    self.assertEqual(left, right)
+                    self.assertLess(max(left), 100)
+                    # The tracks are stopped at the end of the move
+                    steps = (0,) + left + (0,)
+                    largest_change = max(abs(b - a) for a, b in zip(steps, steps[1:]))
+                    # 50%/s over 0.05s steps is 2.5% per step, rounded to whole percents
+                    self.assertLessEqual(largest_change, 3)
+                    travelled = (sum(left) * 0.05 + (args[2] - len(left) * 0.05) * left[-1]) * cm_per_percent
+                    self.assertAlmostEqual(travelled, distance, delta=0.05 * distance)
+
+    def test_plan_ramp_trapezoid_single_step(self):
+        # One step to ramp up in; the ramp down ends with the stop at the end of the move
+        steps = []
+        orig_write = self.tracks._write_pwm
+        def record(left, right):
+            steps.append(left)
+            orig_write(left, right)
+        self.tracks._write_pwm = record
+        orig_sleep = time.sleep
+        time.sleep = lambda x: None
+        try:
+            self.tracks.move(
+                40, 40, duration=0.1, accel=200, accel_interval=0.1, stop_at_end=False,
+                profile="trapezoid",
+            )
+        finally:
+            time.sleep = orig_sleep
+        self.assertEqual(steps[0], 20)
+        self.assertEqual(self.tracks.get_left_track_speed(), 0)
+
+    def test_move_duration_with_accel_decel_to_stop(self):
+        linear = self.tracks._move_duration_with_accel(0, 0, 70, 70, 60.0, 100.0)
+        trapezoid = self.tracks._move_duration_with_accel(0, 0, 70, 70, 60.0, 100.0, decel_to_stop=True)
+        # Decelerating from 70% at 100%/s takes 0.7s and covers half the cruise distance
+        self.assertAlmostEqual(trapezoid - linear, 0.35)
+        # Too short to cruise: accelerate and decelerate symmetrically
+        short = self.tracks._move_duration_with_accel(0, 0, 70, 70, 3.0, 100.0, decel_to_stop=True)
+        self.assertAlmostEqual(short, 2 * (3.0 / (100 * 30 / 3.5 / 70)) ** 0.5)
+        # Already too fast to stop within the distance: the move is only the deceleration
+        with self.assertLogs(level="WARNING"):
+            too_fast = self.tracks._move_duration_with_accel(70, 70, 70, 70, 3.0, 100.0, decel_to_stop=True)
+        self.assertAlmostEqual(too_fast, 0.7)
+
+    def test_move_with_accel_at_target_skips_ramp(self):
+        self.tracks.set_left_track_speed(40)
+        self.tracks.set_right_track_speed(40)
+        calls_before = len(self.dummy_pwm.calls)
+        sleeps = []
+        orig_sleep = time.sleep
+        time.sleep = sleeps.append
+        try:
+            self.tracks.move(40, 40, duration=1, accel=100, accel_interval=0.1, stop_at_end=False)
+        finally:
+            time.sleep = orig_sleep
+        self.assertEqual(sleeps, [1.0])
+        self.assertEqual(len(self.dummy_pwm.calls), calls_before)
+
+    def test_move_with_accel_uses_block_writes(self):
+        pwm = DummyPCA9685()
+        tracks = Tracks(pwm=pwm)
+        # Auto-increment must be enabled for block writes
+        self.assertEqual(pwm._device.registers[0x00], 0x21)
+        orig_sleep = time.sleep
+        time.sleep = lambda x: None
+        try:
+            tracks.move(40, -40, duration=1, accel=100, accel_interval=0.1)
+        finally:
+            time.sleep = orig_sleep
+        # Four ramp steps change both channels; stop() uses the per-channel setters
+        self.assertEqual(len(pwm._device.block_writes), 4)
+        # Default left channel (8) is written first, right channel (9) second
+        register, data = pwm._device.block_writes[-1]
+        self.assertEqual(register, 0x06 + 4 * tracks.left_channel)
+        self.assertEqual(data[2] | (data[3] << 8), tracks._pwm_for_speed(40, tracks.left_channel_reverse))
+        self.assertEqual(data[6] | (data[7] << 8), tracks._pwm_for_speed(-40, tracks.right_channel_reverse))
+        self.assertEqual(tracks.get_left_track_speed(), 0)
+
+    def test_move_with_accel_uses_bulk_hook(self):
+        pwm = DummyBulkPWM()
+        tracks = Tracks(pwm=pwm)
+        tracks.right_channel = 12  # Not adjacent: only the bulk hook can combine writes
+        orig_sleep = time.sleep
+        time.sleep = lambda x: None
+        try:
+            tracks.move(40, -40, duration=1, accel=100, accel_interval=0.1)
+        finally:
+            time.sleep = orig_sleep
+        self.assertEqual(len(pwm.multi_calls), 4)
+        self.assertEqual(
+            pwm.multi_calls[-1],
+            [
+                (tracks.left_channel, 0, tracks._pwm_for_speed(40, tracks.left_channel_reverse)),
+                (12, 0, tracks._pwm_for_speed(-40, tracks.right_channel_reverse)),
+            ],
+        )
+        self.assertEqual(tracks.get_left_track_speed(), 0)
+
+    def test_move_async_with_accel_ramps_speeds(self):
+        async def run():
+            await self.tracks.move_async(
+                40, -40, duration=0.2, accel=400, accel_interval=0.05, stop_at_end=False
+            )
+        asyncio.run(run())
+        # 400%/s with 0.05s steps ramps 20% per step
+        self.assertEqual(self.tracks.get_left_track_speed(), 40)
+        self.assertEqual(self.tracks.get_right_track_speed(), -40)
+        left_offs = [off for ch, _, off in self.dummy_pwm.calls if ch == self.tracks.left_channel]
+        self.assertEqual(
+            left_offs,
+            [self.tracks._pwm_for_speed(v, self.tracks.left_channel_reverse) for v in (20, 40)],
+        )
+
+    def test_move_async_cancel_drops_pending_steps(self):
+        async def run():
+            task = asyncio.create_task(
+                self.tracks.move_async(80, 80, duration=1, accel=40, accel_interval=0.05)
+            )
+            await asyncio.sleep(0.12)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            speed = self.tracks.get_left_track_speed()
+            await asyncio.sleep(0.1)
+            return speed
+        speed = asyncio.run(run())
+        # Tracks keep their last speed, and no further ramp steps are written
+        self.assertGreater(speed, 0)
+        self.assertLess(speed, 80)
+        self.assertEqual(self.tracks.get_left_track_speed(), speed)
+
+    def test_move_async_request_stop_ends_move(self):
+        async def run():
+            task = asyncio.create_task(
+                self.tracks.move_async(80, 80, duration=5, accel=40, accel_interval=0.05)
+            )
+            await asyncio.sleep(0.12)
+            self.tracks.request_stop()
+            await asyncio.wait_for(task, 1)
+        asyncio.run(run())
+        # The move returns early and normally, with the tracks stopped
+        self.assertEqual(self.tracks.get_left_track_speed(), 0)
+        self.assertEqual(self.tracks.get_right_track_speed(), 0)
+
+    def test_move_async_request_stop_from_thread(self):
+        async def run():
+            task = asyncio.create_task(
+                self.tracks.move_async(60, 60, duration=5, stop_at_end=False)
+            )
+            await asyncio.sleep(0.05)
+            self.assertEqual(self.tracks.get_left_track_speed(), 60)
+            threading.Thread(target=self.tracks.request_stop).start()
+            await asyncio.wait_for(task, 1)
+        asyncio.run(run())
+        self.assertEqual(self.tracks.get_left_track_speed(), 0)
+        self.assertEqual(self.tracks.get_right_track_speed(), 0)
+
+    def test_move_async_request_stop_before_steps_are_scheduled(self):
+        # A stop that lands while the move is being planned must not be lost
+        plan_ramp = self.tracks._plan_ramp
+        def stop_then_plan(*args):
+            self.tracks.request_stop()
+            return plan_ramp(*args)
+        self.tracks._plan_ramp = stop_then_plan
+        async def run():
+            await asyncio.wait_for(
+                self.tracks.move_async(80, 80, duration=5, accel=40, accel_interval=0.05), 1
+            )
+        asyncio.run(run())
+        self.assertEqual(self.tracks.get_left_track_speed(), 0)
+        self.assertEqual(self.tracks.get_right_track_speed(), 0)
+        self.assertIsNone(self.tracks._move_finish)
+
+    def test_request_stop_without_move_does_not_cancel_next_move(self):
+        self.tracks.request_stop()
+        async def run():
+            await self.tracks.move_async(60, 60, duration=0.1, stop_at_end=False)
+        asyncio.run(run())
+        self.assertEqual(self.tracks.get_left_track_speed(), 60)
+
+    def test_move_async_write_failure_stops_and_raises(self):
+        def fail_set_pwm(channel, on, off):
+            raise RuntimeError("fail")
+        async def run():
+            self.tracks.pwm.set_pwm = fail_set_pwm
+            await self.tracks.move_async(50, 50, duration=0.2, accel=100, accel_interval=0.05)
+        with self.assertRaises(TracksError):
+            asyncio.run(run())
+
     def test_track_width_cm_settable(self):
         self.tracks.track_width_cm = 20.0
         self.assertEqual(self.tracks.track_width_cm, 20.0)
@@ -171,6 +523,13 @@ class TestTracks(unittest.TestCase):
         self.assertEqual(self.tracks.get_pwm_rev_speed(99), self.tracks.pwm_rev_min + round((99 * 90) / 100))
         self.assertEqual(self.tracks.get_pwm_rev_speed(100), self.tracks.pwm_rev_max)
 
+    def test_pwm_tables_follow_runtime_changes(self):
+        self.assertEqual(self.tracks.get_pwm_fw_speed(100), Tracks.DEFAULT_PWM_FW_MAX)
+        self.tracks.pwm_fw_max = 200
+        self.tracks.pwm_stop = 320
+        self.assertEqual(self.tracks.get_pwm_fw_speed(100), 200)
+        self.assertEqual(self.tracks.get_pwm_rev_speed(0), 320)
+
     def test_track_speeds_for_turn(self):
         # Spin in place left
         l, r = self.tracks._track_speeds_for_turn(70, 0, "left")
@@ -187,6 +546,17 @@ class TestTracks(unittest.TestCase):
         self.assertIsInstance(l, int)
         self.assertIsInstance(r, int)
 
+    def test_current_arc_speed_percent(self):
+        self.tracks.set_left_track_speed(-60)
+        self.tracks.set_right_track_speed(40)
+        # Spin in place averages absolute speeds
+        self.assertEqual(self.tracks._current_arc_speed_percent(0), 50.0)
+        # Arc turn averages signed speeds
+        self.assertEqual(self.tracks._current_arc_speed_percent(20), 10.0)
+        # Independent of calibration
+        self.tracks.base_speed = 50
+        self.assertEqual(self.tracks._current_arc_speed_percent(0), 50.0)
+
     def test_turn_duration_for_angle(self):
         """Test _turn_duration_for_angle for correct duration calculation and error handling.
 
@@ -299,15 +669,15 @@ class TestTracks(unittest.TestCase):
             )
 
     def test_turn_and_turn_async_duration_selection(self):
-        # Patch move and move_async to capture duration
+        # Patch the validated move helpers to capture duration
         durations = {}
-        def fake_move(left, right, duration, **kwargs):
+        def fake_move(left, right, duration, *args):
             durations['sync'] = duration
-        async def fake_move_async(left, right, duration, **kwargs):
+        async def fake_move_async(left, right, duration, *args):
             durations['async'] = duration
 
-        self.tracks.move = fake_move
-        self.tracks.move_async = fake_move_async
+        self.tracks._move_validated = fake_move
+        self.tracks._move_validated_async = fake_move_async
 
         # Use a large angle to avoid duration clamping for meaningful comparison
         test_angle = 720
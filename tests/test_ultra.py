@@ -2,8 +2,9 @@ import unittest
 import threading
 import time
 import asyncio
+import aprsrover.ultra as ultra_module
 from aprsrover.ultra import UltraSonic, UltraSonicError, UltraSonicEvent, GPIOInterface
-from typing import Optional
+from typing import Optional, Sequence
 
 class DummyGPIO:
     BCM = 'BCM'
@@ -40,8 +41,79 @@ class DummyGPIO:
                 return self.LOW
         return self.LOW
     def cleanup(self, pin: Optional[int] = None):
+        if pin is not None and not isinstance(pin, int):
+            raise TypeError("cleanup() takes a single pin")
         self.cleanup_calls.append(pin)
 
+class DummyEdgeGPIO(DummyGPIO):
+    RISING = 'RISING'
+    FALLING = 'FALLING'
+    def __init__(self, pulse_s=(100 * 2) / 34300, edges=True):
+        super().__init__()
+        self.pulse_s = pulse_s
+        self.edges = edges
+        self.level = self.LOW
+        self.rose_at = 0.0
+        self.waits = []
+    def input(self, pin):
+        self.input_calls += 1
+        return self.level if pin == 24 else self.LOW
+    def wait_for_edge(self, pin, edge, timeout=None):
+        self.waits.append((pin, edge, timeout))
+        if not self.edges:
+            return None
+        if edge == self.RISING:
+            self.rose_at = time.perf_counter()
+            self.level = self.HIGH
+        else:
+            time.sleep(max(0.0, self.rose_at + self.pulse_s - time.perf_counter()))
+            self.level = self.LOW
+        return pin
+
+class DummyRacyEdgeGPIO(DummyEdgeGPIO):
+    """Edge GPIO that takes arm_s to arm a wait and misses edges landing in that time."""
+    def __init__(self, rise_s, pulse_s, arm_s=0.001):
+        super().__init__(pulse_s=pulse_s)
+        self.rise_s = rise_s
+        self.arm_s = arm_s
+        self.rise_at = float('inf')
+    def output(self, pin, value):
+        if pin == 23 and value == self.LOW and self.pin_values.get(pin) == self.HIGH:
+            self.rise_at = time.perf_counter() + self.rise_s
+        super().output(pin, value)
+    def input(self, pin):
+        self.input_calls += 1
+        now = time.perf_counter()
+        if pin == 24 and self.rise_at <= now < self.rise_at + self.pulse_s:
+            return self.HIGH
+        return self.LOW
+    def wait_for_edge(self, pin, edge, timeout=None):
+        self.waits.append((pin, edge, timeout))
+        edge_at = self.rise_at if edge == self.RISING else self.rise_at + self.pulse_s
+        armed_from = time.perf_counter()
+        time.sleep(self.arm_s)
+        deadline = armed_from + timeout / 1000
+        if edge_at < time.perf_counter() or edge_at > deadline:
+            # The edge landed before or while arming, or comes too late: the wait times out
+            time.sleep(max(0.0, deadline - time.perf_counter()))
+            return None
+        time.sleep(max(0.0, edge_at - time.perf_counter()))
+        return pin
+
+class DummySequenceGPIO(DummyEdgeGPIO):
+    """Edge GPIO whose successive pulses follow a list of distances (None = no echo)."""
+    def __init__(self, distances_cm):
+        super().__init__()
+        self.distances_cm = list(distances_cm)
+    def wait_for_edge(self, pin, edge, timeout=None):
+        if edge == self.RISING:
+            distance = self.distances_cm.pop(0)
+            if distance is None:
+                self.waits.append((pin, edge, timeout))
+                return None
+            self.pulse_s = (distance * 2) / 34300
+        return super().wait_for_edge(pin, edge, timeout)
+
 class TestUltraSonic(unittest.TestCase):
     def setUp(self):
         self.gpio = DummyGPIO()
@@ -58,13 +130,63 @@ class TestUltraSonic(unittest.TestCase):
         self.assertTrue(called)
         self.ultra.remove_observer(observer)
 
+    def test_measure_distance_median_rejects_outliers(self):
+        gpio = DummySequenceGPIO([100, 400, None, 100, 5, 100])
+        ultra = UltraSonic(trigger_pin=23, echo_pin=24, gpio=gpio, timeout=0.05)
+        called = []
+        ultra.add_observer(lambda e: called.append(e.distance_cm))
+        dist = ultra.measure_distance_median(samples=6, interval=0)
+        self.assertTrue(90 < dist < 150)
+        self.assertEqual(called, [dist])
+
+    def test_measure_distance_median_even_samples_returns_a_reading(self):
+        gpio = DummySequenceGPIO([50, 100, 200, 400])
+        ultra = UltraSonic(trigger_pin=23, echo_pin=24, gpio=gpio, timeout=0.05)
+        readings = []
+        original_ping = ultra._ping
+        def recording_ping():
+            readings.append(original_ping())
+            return readings[-1]
+        ultra._ping = recording_ping
+        dist = ultra.measure_distance_median(samples=4, interval=0)
+        # Lower median, not the mean of the middle two
+        self.assertEqual(dist, sorted(readings)[1])
+
+    def test_measure_distance_median_spaces_pings(self):
+        gpio = DummySequenceGPIO([10, 10, 10])
+        ultra = UltraSonic(trigger_pin=23, echo_pin=24, gpio=gpio, timeout=0.05)
+        start = time.perf_counter()
+        ultra.measure_distance_median(samples=3, interval=0.05)
+        # Two gaps between three pings
+        self.assertGreaterEqual(time.perf_counter() - start, 0.1)
+        with self.assertRaises(ValueError):
+            ultra.measure_distance_median(interval=-1)
+
+    def test_measure_distance_median_all_failed(self):
+        gpio = DummySequenceGPIO([None, None, None])
+        ultra = UltraSonic(trigger_pin=23, echo_pin=24, gpio=gpio, timeout=0.05)
+        with self.assertRaises(UltraSonicError):
+            ultra.measure_distance_median(samples=3, interval=0)
+        with self.assertRaises(ValueError):
+            ultra.measure_distance_median(samples=0)
+
     def test_measure_distance_timeout_high(self):
         # Simulate never getting echo HIGH
         self.gpio.input_calls = 1000
         def always_low(pin): return DummyGPIO.LOW
         self.gpio.input = always_low
-        with self.assertRaises(UltraSonicError):
+        with self.assertRaises(UltraSonicError) as ctx:
             self.ultra.measure_distance()
+        # Raised once, not re-wrapped as "Failed to measure distance: ..."
+        self.assertEqual(str(ctx.exception), "Timeout waiting for echo HIGH")
+
+    def test_measure_distance_hardware_error_wrapped(self):
+        def broken(pin):
+            raise RuntimeError("bus error")
+        self.gpio.input = broken
+        with self.assertRaises(UltraSonicError) as ctx:
+            self.ultra.measure_distance()
+        self.assertIsInstance(ctx.exception.__cause__, RuntimeError)
 
     def test_measure_distance_timeout_low(self):
         # Simulate echo HIGH but never LOW
@@ -78,6 +200,55 @@ class TestUltraSonic(unittest.TestCase):
         with self.assertRaises(UltraSonicError):
             self.ultra.measure_distance()
 
+    def test_measure_distance_with_edge_events(self):
+        gpio = DummyEdgeGPIO()
+        ultra = UltraSonic(trigger_pin=23, echo_pin=24, gpio=gpio, timeout=0.05)
+        dist = ultra.measure_distance()
+        self.assertTrue(90 < dist < 150)
+        self.assertEqual([edge for _, edge, _ in gpio.waits], ['RISING', 'FALLING'])
+        self.assertTrue(all(pin == 24 and timeout >= 1 for pin, _, timeout in gpio.waits))
+
+    def test_measure_distance_with_edge_missed_while_arming(self):
+        # The echo rises, or falls, while the edge wait is still being armed
+        for rise_s, pulse_s, low, high in ((0.0025, (100 * 2) / 34300, 90, 150),
+                                           (0.0005, (45 * 2) / 34300, 20, 60)):
+            with self.subTest(rise_s=rise_s, pulse_s=pulse_s):
+                gpio = DummyRacyEdgeGPIO(rise_s=rise_s, pulse_s=pulse_s)
+                ultra = UltraSonic(trigger_pin=23, echo_pin=24, gpio=gpio, timeout=0.05)
+                dist = ultra.measure_distance()
+                self.assertTrue(low < dist < high, dist)
+
+    def test_measure_distance_close_target_polls_edges(self):
+        # A close target's whole pulse falls within the polling window: no edge waits
+        gpio = DummyRacyEdgeGPIO(rise_s=0.0005, pulse_s=(10 * 2) / 34300)
+        ultra = UltraSonic(trigger_pin=23, echo_pin=24, gpio=gpio, timeout=0.05)
+        dist = ultra.measure_distance()
+        self.assertTrue(5 < dist < 15, dist)
+        self.assertEqual(gpio.waits, [])
+
+    def test_measure_distance_with_edge_events_timeout(self):
+        gpio = DummyEdgeGPIO(edges=False)
+        ultra = UltraSonic(trigger_pin=23, echo_pin=24, gpio=gpio, timeout=0.05)
+        with self.assertRaises(UltraSonicError):
+            ultra.measure_distance()
+
+    def test_measure_distance_skips_settle_when_trigger_already_low(self):
+        ultra = UltraSonic(trigger_pin=23, echo_pin=24, gpio=DummyEdgeGPIO(), timeout=0.05)
+        sleeps = []
+        orig_sleep = time.sleep
+        time.sleep = sleeps.append
+        try:
+            # Trigger has been LOW for more than 2 ms: no settle delay
+            ultra._trigger_low_since = time.perf_counter_ns() - 3_000_000
+            ultra.measure_distance()
+            self.assertNotIn(0.002, sleeps)
+            # Trigger state unknown: drive it LOW and settle first
+            ultra._trigger_low_since = None
+            ultra.measure_distance()
+            self.assertIn(0.002, sleeps)
+        finally:
+            time.sleep = orig_sleep
+
     def test_add_and_remove_observer(self):
         def obs(event): pass
         self.ultra.add_observer(obs)
@@ -85,19 +256,72 @@ class TestUltraSonic(unittest.TestCase):
         self.ultra.remove_observer(obs)
         self.assertNotIn(obs, self.ultra._observers)
 
+    def test_observer_can_unregister_itself(self):
+        called = []
+        def once(event):
+            called.append(event.distance_cm)
+            # Would deadlock if observers were called with the lock held
+            self.ultra.remove_observer(once)
+        self.ultra.add_observer(once)
+        self.ultra._notify_observers(12.3)
+        self.ultra._notify_observers(45.6)
+        self.assertEqual(called, [12.3])
+        self.assertEqual(self.ultra._observers, ())
+
     def test_start_and_stop_monitoring(self):
         self.ultra.start_monitoring(interval=0.01)
         time.sleep(0.05)
         self.ultra.stop_monitoring()
-        self.assertFalse(self.ultra._monitoring.is_set())
+        self.assertTrue(self.ultra._stop_monitor.is_set())
         # Should be able to start again
         self.ultra.start_monitoring(interval=0.01)
         self.ultra.stop_monitoring()
 
+    def test_stop_monitoring_wakes_sleeping_thread(self):
+        self.ultra.start_monitoring(interval=10)
+        start = time.perf_counter()
+        self.ultra.stop_monitoring()
+        self.assertLess(time.perf_counter() - start, 0.5)
+        self.assertFalse(self.ultra._monitor_thread.is_alive())
+
+    def test_start_monitoring_in_event_loop_uses_task(self):
+        called = []
+        self.ultra.add_observer(lambda e: called.append(e.distance_cm))
+        async def run():
+            self.ultra.start_monitoring(interval=0.01)
+            task = self.ultra._monitor_task
+            self.assertIsNotNone(task)
+            self.assertIsNone(self.ultra._monitor_thread)
+            await asyncio.sleep(0.1)
+            self.ultra.stop_monitoring()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+        asyncio.run(run())
+        self.assertTrue(called)
+        self.assertTrue(self.ultra._stop_monitor.is_set())
+
     def test_cleanup(self):
+        # Injected backends get one cleanup(pin) call per pin
         self.ultra.cleanup()
-        self.assertIn(23, self.gpio.cleanup_calls)
-        self.assertIn(24, self.gpio.cleanup_calls)
+        self.assertEqual(self.gpio.cleanup_calls, [23, 24])
+        # A second cleanup is a no-op
+        self.ultra.cleanup()
+        self.assertEqual(self.gpio.cleanup_calls, [23, 24])
+
+    def test_cleanup_rpi_gpio_single_call(self):
+        class TupleCleanupGPIO(DummyGPIO):
+            def cleanup(self, pin: Optional[int | Sequence[int]] = None):
+                self.cleanup_calls.append(pin)
+        gpio = TupleCleanupGPIO()
+        original = ultra_module.GPIO
+        ultra_module.GPIO = gpio
+        try:
+            ultra = UltraSonic(trigger_pin=23, echo_pin=24)
+            ultra.cleanup()
+        finally:
+            ultra_module.GPIO = original
+        # RPi.GPIO releases both channels in one call
+        self.assertEqual(gpio.cleanup_calls, [(23, 24)])
 
     def test_async_measure_distance(self):
         async def run():
@@ -105,6 +329,22 @@ class TestUltraSonic(unittest.TestCase):
             self.assertIsInstance(dist, float)
         asyncio.run(run())
 
+    def test_async_measure_distance_uses_shared_executor(self):
+        ultra = UltraSonic(trigger_pin=23, echo_pin=24, gpio=DummyEdgeGPIO(), timeout=0.05)
+        async def run():
+            await ultra.measure_distance_async()
+            await ultra.measure_distance_async()
+        UltraSonic.shutdown_executor()
+        asyncio.run(run())
+        executor = UltraSonic._executor
+        self.assertIsNotNone(executor)
+        self.assertLessEqual(executor._max_workers, 4)
+        UltraSonic.shutdown_executor()
+        self.assertIsNone(UltraSonic._executor)
+        # A new pool is created on demand after shutdown
+        asyncio.run(run())
+        self.assertIsNotNone(UltraSonic._executor)
+
     def test_async_monitor(self):
         called = []
         def observer(event):
@@ -121,6 +361,16 @@ class TestUltraSonic(unittest.TestCase):
         asyncio.run(run())
         self.assertTrue(called)
 
+    def test_async_monitor_stop_event(self):
+        async def run():
+            stop = asyncio.Event()
+            task = asyncio.create_task(self.ultra.async_monitor(interval=10, stop_event=stop))
+            await asyncio.sleep(0.05)
+            stop.set()
+            # Returns promptly instead of finishing the 10 s wait
+            await asyncio.wait_for(task, timeout=1)
+        asyncio.run(run())
+
     def test_adjust_measurement_based_on_temp_20c(self):
         """Should return the same value at 20°C (reference temp)."""
         result = UltraSonic.adjust_measurement_based_on_temp(20.0, 100.0)
@@ -148,5 +398,34 @@ class TestUltraSonic(unittest.TestCase):
         result = UltraSonic.adjust_measurement_based_on_temp(25.0, 99.98)
         self.assertTrue(result == int(result * 10) / 10)
 
+    def test_adjust_measurement_based_on_temp_table(self):
+        """Hand-computed values, including the 0.1 cm floor and the range boundaries."""
+        cases = [
+            # (temperature_c, measured_cm, expected_cm); speed of sound = 331.3 + 0.6 * t
+            (-40.0, 441.0, 395.1),  # 441 * 307.3 / 343 = 395.1 exactly, must not floor to 395.0
+            (-40.0, 0.1, 0.0),      # 0.0896 floors to 0.0
+            (0.0, 100.0, 96.5),     # 100 * 331.3 / 343 = 96.588
+            (20.0, 100.0, 100.0),   # 100 * 343.3 / 343 = 100.087
+            (25.0, 0.0, 0.0),
+            (30.0, 343.0, 349.3),   # 343 * 349.3 / 343 = 349.3 exactly
+            (60.0, 100.0, 107.0),   # 100 * 367.3 / 343 = 107.084
+            (60.0, 600.0, 642.5),   # 600 * 367.3 / 343 = 642.507
+        ]
+        for temp, dist, expected in cases:
+            with self.subTest(temp=temp, dist=dist):
+                self.assertEqual(UltraSonic.adjust_measurement_based_on_temp(temp, dist), expected)
+
+    def test_adjust_measurement_based_on_temp_batch(self):
+        """Batch adjustment should match the scalar method for every pair."""
+        self.assertEqual(
+            UltraSonic.adjust_measurement_based_on_temp_batch(
+                iter([0.0, 20.0, -40.0, 60.0]), [100.0, 100.0, 441.0, 600.0]
+            ),
+            [96.5, 100.0, 395.1, 642.5],
+        )
+        self.assertEqual(UltraSonic.adjust_measurement_based_on_temp_batch([], []), [])
+        with self.assertRaises(ValueError):
+            UltraSonic.adjust_measurement_based_on_temp_batch([20.0], [1.0, 2.0])
+
 if __name__ == "__main__":
     unittest.main()